@@ -6,17 +6,21 @@ Auto ML Streamlit Frontend Application
 """
 
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import requests
+import io
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import json
-from typing import Dict, Any, List, Optional
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
 import os
+import uuid
 from datetime import datetime
 
+# pandas는 로그인 화면에서 쓰이지 않으므로 실제로 필요한 함수 안에서 import
+if TYPE_CHECKING:
+    import pandas as pd
+
 # 페이지 설정
 st.set_page_config(
     page_title="Auto ML Platform",
@@ -28,8 +32,65 @@ st.set_page_config(
 # API 기본 설정
 API_BASE_URL = os.getenv("API_URL", "http://localhost:8001")
 
+# 일반 API 호출의 (연결, 응답) 타임아웃(초) - 백엔드가 멈춰도 화면이 무한정 멈추지 않도록
+API_TIMEOUT = (5, 30)
+# 업로드는 백엔드가 AutoML 파이프라인까지 돌린 뒤 응답하므로 응답 대기는 제한하지 않음
+UPLOAD_TIMEOUT = (5, None)
+
+# 학습 상태 long-poll 최대 대기 시간(초)
+# 프래그먼트 실행 중에는 세션의 스크립트 스레드가 묶이므로 짧게 유지해 다른 위젯이 바로 반응하게 함
+TRAINING_POLL_MAX_WAIT = 1.5
+# 진행 상황 프래그먼트 실행 주기(초): 한 번의 long-poll보다 길게 잡아 실행 사이에 다른 위젯이 처리될 틈을 둠
+TRAINING_POLL_INTERVAL = 2.0
+
+# 상태 조회가 실패했을 때 다시 시도하기 전 최대 대기 시간(초)
+TRAINING_RETRY_MAX_DELAY = 10
+
+# 업로드 미리보기로 파싱할 최대 행 수 (표와 컬럼 목록에만 사용)
+CSV_PREVIEW_ROWS = 5
+
+# 업로드 가능한 최대 파일 크기(바이트) - 백엔드 MAX_FILE_SIZE와 같은 환경 변수 사용
+MAX_FILE_SIZE = int(os.getenv("MAX_FILE_SIZE", "104857600"))
+
+# 업로드 시 한 번에 보내는 조각 크기(바이트)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# 챗봇 화면에 바로 그리는 최근 메시지 수
+CHAT_VISIBLE_MESSAGES = 30
+
+# 챗봇 스트리밍 중 화면을 갱신하는 최소 간격(초)
+CHAT_STREAM_FLUSH_INTERVAL = 0.08
+
+# 학습 가능한 모델 유형과 설명
+MODEL_TYPES = ("Classification", "Regression", "Clustering", "Recommendation", "Time Series")
+MODEL_DESCRIPTIONS = {
+    "Classification": "📊 **분류 모델**: 범주형 데이터를 예측합니다. 예: 스팸 메일 분류, 고객 등급 분류",
+    "Regression": "📈 **회귀 모델**: 연속형 수치 데이터를 예측합니다. 예: 집값 예측, 매출 예측",
+    "Clustering": "🔍 **군집 모델**: 비슷한 특성을 가진 데이터를 그룹화합니다. 예: 고객 세분화, 상품 그룹화",
+    "Recommendation": "💡 **추천 모델**: 사용자 취향에 맞는 아이템을 추천합니다. 예: 상품 추천, 콘텐츠 추천",
+    "Time Series": "⏰ **시계열 모델**: 시간에 따른 데이터 변화를 예측합니다. 예: 주가 예측, 수요 예측"
+}
+
+# 처음에 기본으로 선택해 두는 특성 변수 수
+DEFAULT_FEATURE_LIMIT = 10
+
+@st.cache_resource
+def get_http() -> requests.Session:
+    """API 호출에 재사용할 커넥션 풀 세션 (리런마다 새로 만들지 않음)"""
+    session = requests.Session()
+    # 모든 브라우저 세션이 이 풀 하나를 공유하고 학습 long-poll은 연결을 오래 잡고 있으므로 넉넉하게 유지
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=50,
+        max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"Accept": "application/json"})
+    return session
+
 # CSS 스타일링
-st.markdown("""
+_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -108,117 +169,145 @@ st.markdown("""
         background-color: #02b351;
     }
 </style>
-""", unsafe_allow_html=True)
-
-# 세션 상태 초기화
-if 'authenticated' not in st.session_state:
-    st.session_state.authenticated = False
-if 'user_data' not in st.session_state:
-    st.session_state.user_data = None
-if 'chat_history' not in st.session_state:
-    st.session_state.chat_history = []
-if 'uploaded_datasets' not in st.session_state:
-    st.session_state.uploaded_datasets = []
-
-def check_api_connection():
-    """API 서버 연결 상태 확인"""
+"""
+
+@st.cache_resource
+def _css_markup() -> str:
+    """들여쓰기와 줄바꿈을 걷어낸 CSS (프로세스당 한 번만 계산)"""
+    return " ".join(_CSS.split())
+
+# 스타일 요소는 매 리런마다 다시 그려야 화면에 남으므로 주입 자체는 생략하지 않고 전송량만 줄임
+st.markdown(_css_markup(), unsafe_allow_html=True)
+
+# 로그인 화면 정적 HTML (리런마다 문자열을 다시 만들지 않도록 모듈 상수로 보관)
+_HERO_HTML = """
+<div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
+            padding: 2rem; border-radius: 1rem; color: white; margin-bottom: 2rem;">
+    <h2 style="text-align: center; margin-bottom: 1rem;">✨ 누구나 쉽게 사용하는 AI 머신러닝</h2>
+    <p style="text-align: center; font-size: 1.1rem; margin-bottom: 0;">
+        코딩 없이도 데이터만 업로드하면 AI가 자동으로 최적의 모델을 찾아드려요!
+    </p>
+</div>
+"""
+
+_FEATURE_CARD_STYLE = (
+    "background: white; padding: 1.5rem; border-radius: 0.8rem; "
+    "box-shadow: 0 2px 10px rgba(0,0,0,0.1); text-align: center; height: 200px;"
+)
+
+_FEATURES_HTML = f"""
+<div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem;">
+    <div style="{_FEATURE_CARD_STYLE}">
+        <div style="font-size: 3rem; margin-bottom: 1rem;">📊</div>
+        <h3 style="color: #2c3e50; margin-bottom: 0.5rem;">간편한 데이터 업로드</h3>
+        <p style="color: #7f8c8d; font-size: 0.9rem;">
+            Excel이나 CSV 파일만 드래그 앤 드롭하면 끝!<br>
+            복잡한 데이터 전처리도 자동으로 처리해요
+        </p>
+    </div>
+    <div style="{_FEATURE_CARD_STYLE}">
+        <div style="font-size: 3rem; margin-bottom: 1rem;">🤖</div>
+        <h3 style="color: #2c3e50; margin-bottom: 0.5rem;">자동 모델 학습</h3>
+        <p style="color: #7f8c8d; font-size: 0.9rem;">
+            AI가 여러 알고리즘을 자동으로 테스트하고<br>
+            가장 성능이 좋은 모델을 추천해드려요
+        </p>
+    </div>
+    <div style="{_FEATURE_CARD_STYLE}">
+        <div style="font-size: 3rem; margin-bottom: 1rem;">💬</div>
+        <h3 style="color: #2c3e50; margin-bottom: 0.5rem;">AI 챗봇 상담</h3>
+        <p style="color: #7f8c8d; font-size: 0.9rem;">
+            모르는 것이 있으면 AI에게 바로 물어보세요!<br>
+            데이터 분석부터 결과 해석까지 도움받아요
+        </p>
+    </div>
+</div>
+"""
+
+_AUDIENCE_HTML = """
+<div style="background: #f8f9fa; padding: 1.5rem; border-radius: 0.8rem; border-left: 4px solid #3498db; margin-top: 2rem;">
+    <h3 style="color: #2c3e50; margin-top: 0;">🎯 이런 분들에게 추천해요!</h3>
+    <ul style="color: #34495e; line-height: 1.8;">
+        <li><strong>소상공인</strong>: 매출 예측, 고객 분석으로 비즈니스 인사이트 얻기</li>
+        <li><strong>마케터</strong>: 고객 세분화, 캠페인 효과 예측으로 마케팅 전략 수립</li>
+        <li><strong>학생·연구자</strong>: 논문 데이터 분석, 연구 프로젝트에 AI 모델 활용</li>
+        <li><strong>일반 사용자</strong>: 개인 데이터(가계부, 운동기록 등) 패턴 분석</li>
+    </ul>
+</div>
+"""
+
+_LOGIN_BOX_HTML = """
+<div style="max-width: 500px; margin: 2rem auto; padding: 2rem; 
+            background-color: #ffffff; border-radius: 1rem; 
+            box-shadow: 0 4px 20px rgba(0, 0, 0, 0.1);">
+    <h2 style="text-align: center; margin-bottom: 1rem; color: #2c3e50;">🔐 시작하기</h2>
+    <p style="text-align: center; color: #7f8c8d; margin-bottom: 2rem;">
+        소셜 계정으로 3초만에 시작하세요
+    </p>
+</div>
+"""
+
+_GUEST_CARD_HTML = """
+<div style="background: #fff3cd; padding: 1.5rem; border-radius: 0.8rem; 
+            border: 1px solid #ffeaa7; text-align: center; margin-bottom: 1rem;">
+    <h3 style="color: #856404; margin-top: 0; margin-bottom: 1rem;">🎯 먼저 체험해보고 싶으신가요?</h3>
+    <p style="color: #856404; margin-bottom: 1rem; line-height: 1.6;">
+        로그인 없이도 모든 기능을 체험할 수 있어요!<br>
+        <small>⚠️ 단, 파일과 학습 기록은 저장되지 않습니다</small>
+    </p>
+</div>
+"""
+
+# 세션 상태 초기화 (세션당 한 번만)
+if '_initialized' not in st.session_state:
+    for key, value in {
+        'authenticated': False,
+        'user_data': None,
+        'chat_history': [],
+        'uploaded_datasets': []
+    }.items():
+        st.session_state.setdefault(key, value)
+    st.session_state._initialized = True
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _check_api_connection_cached() -> bool:
+    """API 서버 연결 상태 확인 (30초 동안 결과 캐시)"""
     try:
-        response = requests.get(f"{API_BASE_URL}/health", timeout=5)
+        response = get_http().get(f"{API_BASE_URL}/health", timeout=5)
         return response.status_code == 200
     except:
         return False
 
+@st.fragment
 def login_page():
-    """로그인 페이지"""
+    """로그인 페이지 (이 화면의 위젯 조작은 프래그먼트만 다시 실행)"""
     st.markdown('<div class="main-header">🤖 Auto ML Platform</div>', unsafe_allow_html=True)
     
     # API 연결 상태 확인
-    if not check_api_connection():
+    if not _check_api_connection_cached():
         st.error("❌ API 서버에 연결할 수 없습니다. 백엔드 서버가 실행 중인지 확인해주세요.")
         st.info("백엔드 서버 실행 방법:\n```bash\ncd backend\npython main.py\n```")
+        if st.button("🔄 재확인", key="recheck_api"):
+            # 캐시된 연결 상태를 버리고 즉시 다시 확인
+            _check_api_connection_cached.clear()
+            st.rerun()
         return
     
     # 프로그램 전반적인 설명 (머신러닝 초보자를 위해)
-    st.markdown("""
-    <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
-                padding: 2rem; border-radius: 1rem; color: white; margin-bottom: 2rem;">
-        <h2 style="text-align: center; margin-bottom: 1rem;">✨ 누구나 쉽게 사용하는 AI 머신러닝</h2>
-        <p style="text-align: center; font-size: 1.1rem; margin-bottom: 0;">
-            코딩 없이도 데이터만 업로드하면 AI가 자동으로 최적의 모델을 찾아드려요!
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # 주요 기능 소개
-    col1, col2, col3 = st.columns(3)
+    st.markdown(_HERO_HTML, unsafe_allow_html=True)
     
-    with col1:
-        st.markdown("""
-        <div style="background: white; padding: 1.5rem; border-radius: 0.8rem; 
-                    box-shadow: 0 2px 10px rgba(0,0,0,0.1); text-align: center; height: 200px;">
-            <div style="font-size: 3rem; margin-bottom: 1rem;">📊</div>
-            <h3 style="color: #2c3e50; margin-bottom: 0.5rem;">간편한 데이터 업로드</h3>
-            <p style="color: #7f8c8d; font-size: 0.9rem;">
-                Excel이나 CSV 파일만 드래그 앤 드롭하면 끝!<br>
-                복잡한 데이터 전처리도 자동으로 처리해요
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div style="background: white; padding: 1.5rem; border-radius: 0.8rem; 
-                    box-shadow: 0 2px 10px rgba(0,0,0,0.1); text-align: center; height: 200px;">
-            <div style="font-size: 3rem; margin-bottom: 1rem;">🤖</div>
-            <h3 style="color: #2c3e50; margin-bottom: 0.5rem;">자동 모델 학습</h3>
-            <p style="color: #7f8c8d; font-size: 0.9rem;">
-                AI가 여러 알고리즘을 자동으로 테스트하고<br>
-                가장 성능이 좋은 모델을 추천해드려요
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown("""
-        <div style="background: white; padding: 1.5rem; border-radius: 0.8rem; 
-                    box-shadow: 0 2px 10px rgba(0,0,0,0.1); text-align: center; height: 200px;">
-            <div style="font-size: 3rem; margin-bottom: 1rem;">💬</div>
-            <h3 style="color: #2c3e50; margin-bottom: 0.5rem;">AI 챗봇 상담</h3>
-            <p style="color: #7f8c8d; font-size: 0.9rem;">
-                모르는 것이 있으면 AI에게 바로 물어보세요!<br>
-                데이터 분석부터 결과 해석까지 도움받아요
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+    # 주요 기능 소개 (카드 3개를 한 번에 그리드로 렌더링)
+    st.markdown(_FEATURES_HTML, unsafe_allow_html=True)
     
     st.markdown("<br><br><br>", unsafe_allow_html=True)
     
     # 이런 분들에게 추천
-    st.markdown("""
-    <div style="background: #f8f9fa; padding: 1.5rem; border-radius: 0.8rem; border-left: 4px solid #3498db; margin-top: 2rem;">
-        <h3 style="color: #2c3e50; margin-top: 0;">🎯 이런 분들에게 추천해요!</h3>
-        <ul style="color: #34495e; line-height: 1.8;">
-            <li><strong>소상공인</strong>: 매출 예측, 고객 분석으로 비즈니스 인사이트 얻기</li>
-            <li><strong>마케터</strong>: 고객 세분화, 캠페인 효과 예측으로 마케팅 전략 수립</li>
-            <li><strong>학생·연구자</strong>: 논문 데이터 분석, 연구 프로젝트에 AI 모델 활용</li>
-            <li><strong>일반 사용자</strong>: 개인 데이터(가계부, 운동기록 등) 패턴 분석</li>
-        </ul>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_AUDIENCE_HTML, unsafe_allow_html=True)
     
     st.markdown("<br>", unsafe_allow_html=True)
     
     # 로그인 섹션 - 가운데 정렬
-    st.markdown("""
-    <div style="max-width: 500px; margin: 2rem auto; padding: 2rem; 
-                background-color: #ffffff; border-radius: 1rem; 
-                box-shadow: 0 4px 20px rgba(0, 0, 0, 0.1);">
-        <h2 style="text-align: center; margin-bottom: 1rem; color: #2c3e50;">🔐 시작하기</h2>
-        <p style="text-align: center; color: #7f8c8d; margin-bottom: 2rem;">
-            소셜 계정으로 3초만에 시작하세요
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_LOGIN_BOX_HTML, unsafe_allow_html=True)
     
     # 로그인 버튼들을 가운데 정렬
     col_left, col_center, col_right = st.columns([1, 2, 1])
@@ -239,16 +328,7 @@ def login_page():
     col_left2, col_center2, col_right2 = st.columns([1, 2, 1])
     
     with col_center2:
-        st.markdown("""
-        <div style="background: #fff3cd; padding: 1.5rem; border-radius: 0.8rem; 
-                    border: 1px solid #ffeaa7; text-align: center; margin-bottom: 1rem;">
-            <h3 style="color: #856404; margin-top: 0; margin-bottom: 1rem;">🎯 먼저 체험해보고 싶으신가요?</h3>
-            <p style="color: #856404; margin-bottom: 1rem; line-height: 1.6;">
-                로그인 없이도 모든 기능을 체험할 수 있어요!<br>
-                <small>⚠️ 단, 파일과 학습 기록은 저장되지 않습니다</small>
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_GUEST_CARD_HTML, unsafe_allow_html=True)
         
         if st.button("🔓 로그인 없이 체험하기", key="guest_mode", use_container_width=True):
             st.session_state.authenticated = True
@@ -260,6 +340,59 @@ def login_page():
             }
             st.rerun()
 
+class MultipartUpload:
+    """파일 하나를 담은 multipart/form-data 본문 (chunked 전송, 재시도 시 처음부터 다시 순회 가능)"""
+    
+    def __init__(self, field: str, filename: str, raw: memoryview, content_type: str):
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        self._head = (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field}"; filename="{filename.replace(chr(34), "%22")}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode()
+        self._raw = memoryview(raw)
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode()
+    
+    def __iter__(self):
+        yield self._head
+        for start in range(0, len(self._raw), UPLOAD_CHUNK_SIZE):
+            yield bytes(self._raw[start:start + UPLOAD_CHUNK_SIZE])
+        yield self._tail
+
+@st.cache_data(show_spinner=False)
+def read_csv_preview(file_id: str, _file: io.BytesIO) -> "pd.DataFrame":
+    """업로드된 CSV의 앞부분만 파싱 (업로드 id로 캐시해서 파일 전체를 해싱하지 않음)"""
+    import pandas as pd
+    _file.seek(0)
+    return pd.read_csv(_file, nrows=CSV_PREVIEW_ROWS)
+
+def upload_dataset(uploaded_file) -> Optional[Dict]:
+    """파일을 백엔드에 업로드 (같은 업로드면 세션에 저장된 결과 재사용, 실패 시 None)"""
+    cached = st.session_state.get("dataset_info")
+    if cached and cached["file_id"] == uploaded_file.file_id:
+        return cached["result"]
+    
+    # 업로드 버퍼를 복사하지 않고 그대로 전송 (getvalue()는 파일 전체를 bytes로 복사)
+    raw = uploaded_file.getbuffer()
+    
+    # 파일 업로드 API 호출 (multipart 본문을 메모리에 다시 만들지 않고 조각 단위로 전송)
+    body = MultipartUpload("file", uploaded_file.name, raw, "text/csv")
+    response = get_http().post(
+        f"{API_BASE_URL}/api/data/upload",
+        data=body,
+        headers={"Content-Type": body.content_type},
+        timeout=UPLOAD_TIMEOUT
+    )
+    
+    if response.status_code != 200:
+        st.error(f"❌ 파일 업로드 실패: {response.text}")
+        return None
+    
+    result = response.json()
+    st.session_state.dataset_info = {"file_id": uploaded_file.file_id, "result": result}
+    return result
+
 def data_upload_section():
     """데이터 업로드 섹션"""
     st.markdown('<div class="sub-header">📊 데이터 업로드</div>', unsafe_allow_html=True)
@@ -271,82 +404,87 @@ def data_upload_section():
     )
     
     if uploaded_file is not None:
+        # 백엔드 제한보다 큰 파일은 전송하기 전에 거절
+        if uploaded_file.size > MAX_FILE_SIZE:
+            st.error(f"❌ 파일이 너무 큽니다: {uploaded_file.size / 1e6:.1f} MB (최대 {MAX_FILE_SIZE / 1e6:.0f} MB)")
+            return None, None
+        
         try:
-            # 파일 업로드 API 호출
-            files = {"file": uploaded_file}
-            response = requests.post(f"{API_BASE_URL}/api/data/upload", files=files)
+            # 같은 파일이면 리런마다 다시 업로드하지 않음
+            result = upload_dataset(uploaded_file)
             
-            if response.status_code == 200:
-                result = response.json()
+            if result is not None:
                 st.success("✅ 파일이 성공적으로 업로드되었습니다!")
                 
-                # 데이터 미리보기
-                df = pd.read_csv(uploaded_file)
+                # 데이터 미리보기 (전체 파싱은 백엔드에서만 수행)
+                df = read_csv_preview(uploaded_file.file_id, uploaded_file)
                 st.markdown("#### 📋 데이터 미리보기")
                 st.dataframe(df.head())
                 
-                # 기본 통계
+                # 기본 통계 (백엔드가 전체 데이터로 계산한 값)
                 col1, col2, col3, col4 = st.columns(4)
                 with col1:
-                    st.metric("행 수", f"{len(df):,}")
+                    st.metric("행 수", f"{result['row_count']:,}")
                 with col2:
-                    st.metric("열 수", len(df.columns))
+                    st.metric("열 수", result["col_count"])
                 with col3:
-                    st.metric("수치형 열", len(df.select_dtypes(include=['number']).columns))
+                    st.metric("수치형 열", result["numeric_count"])
                 with col4:
-                    st.metric("범주형 열", len(df.select_dtypes(include=['object']).columns))
+                    st.metric("범주형 열", result["categorical_count"])
                 
                 return result, df
-            else:
-                st.error(f"❌ 파일 업로드 실패: {response.text}")
                 
         except Exception as e:
             st.error(f"❌ 파일 업로드 중 오류가 발생했습니다: {str(e)}")
     
     return None, None
 
-def model_training_section(dataset_info: Dict, df: pd.DataFrame):
+@st.cache_data(show_spinner=False)
+def _feature_lists(columns: tuple) -> tuple:
+    """특성 후보와 기본 선택 목록 (같은 컬럼 구성이면 캐시 사용)"""
+    available = list(columns)
+    return available, available[:DEFAULT_FEATURE_LIMIT]
+
+def model_training_section(dataset_info: Dict, df: "pd.DataFrame"):
     """모델 학습 섹션"""
     st.markdown('<div class="sub-header">🤖 모델 학습 설정</div>', unsafe_allow_html=True)
     
     # 모델 유형 선택
     model_type = st.selectbox(
         "학습할 모델 유형을 선택하세요",
-        ["Classification", "Regression", "Clustering", "Recommendation", "Time Series"],
+        MODEL_TYPES,
         help="데이터의 특성에 맞는 모델 유형을 선택하세요"
     )
     
-    # 타겟 변수 선택 (Clustering 제외)
-    target_column = None
-    if model_type != "Clustering":
-        target_column = st.selectbox(
-            "타겟 변수(예측하고자 하는 변수)를 선택하세요",
-            df.columns.tolist(),
-            help="모델이 예측해야 하는 목표 변수를 선택하세요"
-        )
-    
-    # 특성 변수 선택
-    available_features = [col for col in df.columns if col != target_column]
-    selected_features = st.multiselect(
-        "학습에 사용할 특성 변수들을 선택하세요",
-        available_features,
-        default=available_features[:min(10, len(available_features))],
-        help="모델 학습에 사용할 입력 변수들을 선택하세요"
-    )
+    st.info(MODEL_DESCRIPTIONS[model_type])
     
-    # 모델 설명
-    model_descriptions = {
-        "Classification": "📊 **분류 모델**: 범주형 데이터를 예측합니다. 예: 스팸 메일 분류, 고객 등급 분류",
-        "Regression": "📈 **회귀 모델**: 연속형 수치 데이터를 예측합니다. 예: 집값 예측, 매출 예측",
-        "Clustering": "🔍 **군집 모델**: 비슷한 특성을 가진 데이터를 그룹화합니다. 예: 고객 세분화, 상품 그룹화",
-        "Recommendation": "💡 **추천 모델**: 사용자 취향에 맞는 아이템을 추천합니다. 예: 상품 추천, 콘텐츠 추천",
-        "Time Series": "⏰ **시계열 모델**: 시간에 따른 데이터 변화를 예측합니다. 예: 주가 예측, 수요 예측"
-    }
+    available_features, default_features = _feature_lists(tuple(df.columns))
     
-    st.info(model_descriptions[model_type])
+    # 타겟/특성 선택은 폼으로 묶어 학습 시작을 누를 때만 다시 실행
+    with st.form("train_cfg"):
+        # 타겟 변수 선택 (Clustering 제외)
+        target_column = None
+        if model_type != "Clustering":
+            target_column = st.selectbox(
+                "타겟 변수(예측하고자 하는 변수)를 선택하세요",
+                available_features,
+                help="모델이 예측해야 하는 목표 변수를 선택하세요"
+            )
+        
+        # 특성 변수 선택 (폼 안에서는 타겟 변경이 바로 반영되지 않으므로 전체 컬럼을 보여주고
+        # 제출할 때 타겟 컬럼을 제외)
+        selected_features = st.multiselect(
+            "학습에 사용할 특성 변수들을 선택하세요",
+            available_features,
+            default=default_features,
+            help="모델 학습에 사용할 입력 변수들을 선택하세요 (타겟 변수는 자동으로 제외됩니다)"
+        )
+        
+        # 학습 시작 버튼
+        submitted = st.form_submit_button("🚀 모델 학습 시작")
     
-    # 학습 시작 버튼
-    if st.button("🚀 모델 학습 시작", key="start_training"):
+    if submitted:
+        selected_features = [col for col in selected_features if col != target_column]
         if not selected_features:
             st.error("❌ 최소 하나의 특성 변수를 선택해주세요.")
             return
@@ -361,119 +499,205 @@ def model_training_section(dataset_info: Dict, df: pd.DataFrame):
         }
         
         try:
-            response = requests.post(f"{API_BASE_URL}/api/ml/train", json=training_data)
+            response = get_http().post(f"{API_BASE_URL}/api/ml/train", json=training_data, timeout=API_TIMEOUT)
             
             if response.status_code == 200:
                 result = response.json()
-                task_id = result["task_id"]
-                
-                # 진행 상황 모니터링
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-                
-                while True:
-                    # 작업 상태 확인
-                    status_response = requests.get(f"{API_BASE_URL}/api/tasks/status/{task_id}")
-                    
-                    if status_response.status_code == 200:
-                        status_data = status_response.json()
-                        
-                        if status_data["status"] == "progress":
-                            progress = status_data.get("progress", 0)
-                            message = status_data.get("message", "처리 중...")
-                            progress_bar.progress(progress / 100)
-                            status_text.text(f"진행률: {progress}% - {message}")
-                            
-                        elif status_data["status"] == "success":
-                            progress_bar.progress(100)
-                            status_text.text("✅ 모델 학습 완료!")
-                            
-                            # 결과 표시
-                            result_data = status_data["result"]
-                            st.success(result_data["message"])
-                            
-                            # 성능 지표 표시
-                            if "performance_metrics" in result_data:
-                                st.markdown("#### 📈 모델 성능 지표")
-                                metrics = result_data["performance_metrics"]
-                                
-                                cols = st.columns(len(metrics))
-                                for i, (metric, value) in enumerate(metrics.items()):
-                                    with cols[i]:
-                                        st.metric(metric.upper(), f"{value:.4f}")
-                            
-                            break
-                            
-                        elif status_data["status"] == "failure":
-                            st.error(f"❌ 모델 학습 실패: {status_data.get('error', '알 수 없는 오류')}")
-                            break
-                            
-                        else:
-                            status_text.text("대기 중...")
-                    
-                    time.sleep(2)  # 2초마다 상태 확인
-                    
+
+                # 진행 상황은 training_progress 프래그먼트가 따로 폴링
+                st.session_state.training_task = {
+                    "task_id": result["task_id"],
+                    "attempt": 0,
+                    "last": None,
+                    "outcome": None
+                }
             else:
                 st.error(f"❌ 모델 학습 요청 실패: {response.text}")
-                
+
         except Exception as e:
             st.error(f"❌ 모델 학습 중 오류가 발생했습니다: {str(e)}")
 
+    # 진행 중이거나 끝난 학습 작업 표시
+    task = st.session_state.get("training_task")
+    if task:
+        if task["outcome"]:
+            show_training_outcome(task["outcome"])
+        else:
+            training_progress()
+
+def show_training_status(status_data: Optional[Dict]):
+    """마지막으로 받은 작업 상태를 st.status 안에 한 번만 표시"""
+    with st.status("🚀 모델 학습 중...", expanded=True):
+        if status_data and status_data["status"] == "progress":
+            progress = status_data.get("progress", 0)
+            message = status_data.get("message", "처리 중...")
+            st.progress(progress / 100)
+            st.text(f"진행률: {progress}% - {message}")
+        else:
+            st.text("대기 중...")
+
+@st.fragment(run_every=TRAINING_POLL_INTERVAL)
+def training_progress():
+    """학습 진행 상황 폴링 (이 프래그먼트만 짧게 다시 실행되므로 나머지 화면은 재실행되지 않음)"""
+    task = st.session_state.training_task
+
+    # 직전 요청이 실패했으면 backoff 시간이 지날 때까지 요청하지 않음
+    if time.monotonic() < task.get("retry_at", 0):
+        show_training_status(task["last"])
+        return
+
+    # 상태가 바뀌면 서버가 바로 응답하고, 그대로면 wait초 후 응답 (짧은 long-poll)
+    wait = TRAINING_POLL_MAX_WAIT
+    params = {"wait": wait}
+    if task["last"]:
+        params["last_status"] = task["last"]["status"]
+        if "progress" in task["last"]:
+            params["last_progress"] = task["last"]["progress"]
+
+    # 기다리는 동안에는 이전 실행의 표시가 그대로 남아 있으므로 응답을 받은 뒤 한 번만 그림
+    try:
+        status_response = get_http().get(
+            f"{API_BASE_URL}/api/tasks/status/{task['task_id']}",
+            params=params,
+            timeout=(3, wait + 2)
+        )
+    except requests.RequestException:
+        status_response = None
+
+    if status_response is None or status_response.status_code != 200:
+        task["attempt"] += 1
+        task["retry_at"] = time.monotonic() + min(TRAINING_RETRY_MAX_DELAY, 1.5 ** task["attempt"])
+        show_training_status(task["last"])
+        return
+
+    status_data = status_response.json()
+    # attempt는 실패 backoff에만 사용
+    task["attempt"] = 0
+    task["last"] = status_data
+
+    if status_data["status"] in ("success", "failure"):
+        # 결과를 저장하고 전체 앱을 다시 실행해 폴링을 멈춤
+        task["outcome"] = status_data
+        if status_data["status"] == "success":
+            # 새 모델이 모델 관리 탭에 바로 보이도록 목록 캐시 무효화
+            list_models.clear()
+        st.rerun()
+
+    show_training_status(status_data)
+
+def show_training_outcome(status_data: Dict):
+    """끝난 학습 작업의 결과 표시"""
+    if status_data["status"] == "failure":
+        st.error(f"❌ 모델 학습 실패: {status_data.get('error', '알 수 없는 오류')}")
+        return
+
+    st.progress(100)
+    st.text("✅ 모델 학습 완료!")
+
+    # 결과 표시
+    result_data = status_data["result"]
+    st.success(result_data["message"])
+
+    # 성능 지표 표시
+    if "performance_metrics" in result_data:
+        st.markdown("#### 📈 모델 성능 지표")
+        metrics = result_data["performance_metrics"]
+
+        cols = st.columns(len(metrics))
+        for i, (metric, value) in enumerate(metrics.items()):
+            with cols[i]:
+                st.metric(metric.upper(), f"{value:.4f}")
+
+def render_chat_messages(messages: List[Dict[str, str]]):
+    """채팅 메시지 목록 렌더링"""
+    for message in messages:
+        with st.chat_message(message["role"]):
+            st.markdown(message["content"])
+
+def iter_chat_deltas(response: requests.Response):
+    """SSE 스트림 응답에서 챗봇 응답 조각을 순서대로 꺼냄"""
+    for line in response.iter_lines(decode_unicode=True):
+        if not line or not line.startswith("data: "):
+            continue
+        event = json.loads(line[len("data: "):])
+        if "error" in event:
+            yield event["error"]
+            return
+        yield event.get("delta", "")
+
+def render_chat_stream(deltas) -> str:
+    """스트리밍 중에는 일정 간격으로 모아서 plain text로, 끝나면 markdown으로 한 번 렌더링"""
+    placeholder = st.empty()
+    buffer = ""
+    last_flush = time.monotonic()
+    
+    for delta in deltas:
+        buffer += delta
+        now = time.monotonic()
+        if now - last_flush >= CHAT_STREAM_FLUSH_INTERVAL:
+            placeholder.text(buffer)
+            last_flush = now
+    
+    placeholder.markdown(buffer)
+    return buffer
+
+@st.fragment
 def chat_section():
-    """RAG 챗봇 섹션"""
+    """RAG 챗봇 섹션 (메시지를 보내도 이 프래그먼트만 다시 실행)"""
     st.markdown('<div class="sub-header">💬 AI 챗봇과 대화하기</div>', unsafe_allow_html=True)
     st.markdown("데이터와 모델에 대해 궁금한 것을 물어보세요! AI가 도움을 드립니다.")
     
-    # 채팅 히스토리 표시
-    chat_container = st.container()
+    # 채팅 히스토리 표시 (최근 메시지만 그리고 이전 대화는 펼쳤을 때만 렌더링)
+    history = st.session_state.chat_history
+    older, visible = history[:-CHAT_VISIBLE_MESSAGES], history[-CHAT_VISIBLE_MESSAGES:]
     
-    with chat_container:
-        for i, message in enumerate(st.session_state.chat_history):
-            if message["role"] == "user":
-                st.markdown(f"**🙋‍♂️ 사용자**: {message['content']}")
-            else:
-                st.markdown(f"**🤖 AI**: {message['content']}")
-            st.markdown("---")
+    if older:
+        with st.expander(f"이전 대화 보기 ({len(older)}개)"):
+            if st.toggle("불러오기", key="show_older_chat"):
+                render_chat_messages(older)
     
-    # 채팅 입력
-    user_input = st.text_input(
-        "메시지를 입력하세요",
-        key="chat_input",
-        placeholder="예: '업로드한 데이터의 특징을 알려주세요', '어떤 모델이 가장 적합할까요?'"
-    )
+    render_chat_messages(visible)
     
-    col1, col2 = st.columns([1, 4])
-    with col1:
-        send_button = st.button("📤 전송", key="send_chat")
-    with col2:
-        if st.button("🗑️ 채팅 기록 지우기", key="clear_chat"):
-            st.session_state.chat_history = []
-            st.rerun()
+    if st.button("🗑️ 채팅 기록 지우기", key="clear_chat"):
+        st.session_state.chat_history = []
+        st.session_state.pop("conversation_id", None)
+        st.rerun(scope="fragment")
+    
+    # 채팅 입력
+    user_input = st.chat_input("예: '업로드한 데이터의 특징을 알려주세요', '어떤 모델이 가장 적합할까요?'")
     
-    if send_button and user_input:
+    if user_input:
+        # 대화 식별자 (서버가 이전 대화 문맥을 이 id로 보관하므로 히스토리는 다시 보내지 않음)
+        if "conversation_id" not in st.session_state:
+            st.session_state.conversation_id = str(uuid.uuid4())
+        
         # 사용자 메시지 추가
         st.session_state.chat_history.append({"role": "user", "content": user_input})
+        with st.chat_message("user"):
+            st.markdown(user_input)
         
         try:
-            # 챗봇 API 호출
+            # 챗봇 API 호출 (응답을 조각 단위로 스트리밍)
             chat_data = {
                 "message": user_input,
-                "user_id": st.session_state.user_data["id"]
+                "user_id": st.session_state.user_data["id"],
+                "conversation_id": st.session_state.conversation_id
             }
             
-            response = requests.post(f"{API_BASE_URL}/api/chat/message", json=chat_data)
-            
-            if response.status_code == 200:
-                result = response.json()
-                ai_response = result["response"]
-                
-                # AI 응답 추가
-                st.session_state.chat_history.append({"role": "assistant", "content": ai_response})
-            else:
-                st.session_state.chat_history.append({
-                    "role": "assistant", 
-                    "content": "죄송합니다. 현재 응답할 수 없습니다. 잠시 후 다시 시도해주세요."
-                })
+            with get_http().post(
+                f"{API_BASE_URL}/api/chat/message", json=chat_data, stream=True, timeout=(5, 120)
+            ) as response:
+                if response.status_code == 200:
+                    with st.chat_message("assistant"):
+                        ai_response = render_chat_stream(iter_chat_deltas(response))
+                    
+                    # 스트림이 끝난 뒤 AI 응답을 한 번만 추가
+                    st.session_state.chat_history.append({"role": "assistant", "content": ai_response})
+                else:
+                    st.session_state.chat_history.append({
+                        "role": "assistant", 
+                        "content": "죄송합니다. 현재 응답할 수 없습니다. 잠시 후 다시 시도해주세요."
+                    })
                 
         except Exception as e:
             st.session_state.chat_history.append({
@@ -481,7 +705,59 @@ def chat_section():
                 "content": f"오류가 발생했습니다: {str(e)}"
             })
         
-        st.rerun()
+        st.rerun(scope="fragment")
+
+def _format_model_time(created_time: float) -> str:
+    """모델 파일 생성 시각(epoch 초)을 표시용 문자열로 변환"""
+    return datetime.fromtimestamp(created_time).strftime("%Y-%m-%d %H:%M")
+
+def model_overview_rows(models: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """모델 목록 요약 표의 행 (/api/ml/models 항목: name, path, size, created_time)"""
+    return [
+        {
+            "이름": model["name"],
+            "크기(KB)": round(model["size"] / 1024, 1),
+            "생성일": _format_model_time(model["created_time"]),
+        }
+        for model in models
+    ]
+
+def render_model_details(model: Dict[str, Any]):
+    """모델 상세 정보와 예측 버튼 렌더링"""
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.write(f"**생성일**: {_format_model_time(model['created_time'])}")
+        st.write(f"**크기**: {model['size'] / 1024:.1f} KB")
+    
+    with col2:
+        st.write(f"**경로**: `{model['path']}`")
+    
+    # 예측 기능 (저장된 모델 파일은 학습이 끝난 모델)
+    if st.button(f"🔮 {model['name']} 예측하기", key=f"predict_{model['name']}"):
+        st.info("예측 기능은 개발 중입니다.")
+
+@st.cache_resource
+def _model_list_etags() -> Dict[Any, tuple]:
+    """사용자별 마지막 모델 목록과 ETag (캐시가 만료돼도 조건부 요청에 재사용)"""
+    return {}
+
+@st.cache_data(ttl=30, show_spinner=False)
+def list_models(user_id) -> Optional[list]:
+    """모델 목록 조회 (ETag가 같으면 이전 응답을 재사용, 실패 시 None)"""
+    etags = _model_list_etags()
+    etag, models = etags.get(user_id, (None, None))
+    headers = {"If-None-Match": etag} if etag else {}
+    
+    response = get_http().get(f"{API_BASE_URL}/api/ml/models", headers=headers, timeout=API_TIMEOUT)
+    if response.status_code == 304 and models is not None:
+        return models
+    if response.status_code != 200:
+        return None
+    
+    models = response.json()["models"]
+    etags[user_id] = (response.headers.get("ETag"), models)
+    return models
 
 def main_app():
     """메인 애플리케이션"""
@@ -501,6 +777,9 @@ def main_app():
             st.session_state.authenticated = False
             st.session_state.user_data = None
             st.session_state.chat_history = []
+            st.session_state.pop("conversation_id", None)
+            st.session_state.pop("dataset_info", None)
+            resolve_token.clear()
             st.rerun()
     
     # 메인 콘텐츠 탭
@@ -522,32 +801,23 @@ def main_app():
         st.markdown("### 📋 학습된 모델 목록")
         
         try:
-            # 사용자의 모델 목록 조회
-            response = requests.get(f"{API_BASE_URL}/api/ml/models")
+            # 사용자의 모델 목록 조회 (변경이 없으면 서버가 304를 반환)
+            models = list_models(user_data["id"])
             
-            if response.status_code == 200:
-                models = response.json()
-                
+            if models is not None:
                 if models:
-                    for model in models:
-                        with st.expander(f"🤖 {model['name']} ({model['model_type']})"):
-                            col1, col2 = st.columns(2)
-                            
-                            with col1:
-                                st.write(f"**생성일**: {model['created_at']}")
-                                st.write(f"**상태**: {model['training_status']}")
-                                st.write(f"**알고리즘**: {model.get('algorithm', 'N/A')}")
-                            
-                            with col2:
-                                if model.get('performance_metrics'):
-                                    st.write("**성능 지표**:")
-                                    for metric, value in model['performance_metrics'].items():
-                                        st.write(f"- {metric}: {value}")
-                            
-                            # 예측 기능
-                            if model['training_status'] == 'completed':
-                                if st.button(f"🔮 {model['name']} 예측하기", key=f"predict_{model['id']}"):
-                                    st.info("예측 기능은 개발 중입니다.")
+                    # 모델 수와 관계없이 표 하나로 요약하고, 선택한 모델만 상세 정보를 렌더링
+                    st.dataframe(model_overview_rows(models), use_container_width=True, hide_index=True)
+                    
+                    selected = st.selectbox(
+                        "세부 보기",
+                        range(len(models)),
+                        index=None,
+                        format_func=lambda i: f"🤖 {models[i]['name']}",
+                        placeholder="상세 정보를 볼 모델을 선택하세요"
+                    )
+                    if selected is not None:
+                        render_model_details(models[selected])
                 else:
                     st.info("아직 학습된 모델이 없습니다. '데이터 & 모델' 탭에서 모델을 학습해보세요!")
             else:
@@ -556,24 +826,34 @@ def main_app():
         except Exception as e:
             st.error(f"모델 목록 조회 중 오류가 발생했습니다: {str(e)}")
 
+@st.cache_data(ttl=300, show_spinner=False)
+def resolve_token(token: str) -> Optional[Dict[str, Any]]:
+    """인증 토큰으로 사용자 정보 조회 (유효하지 않은 토큰이면 None)"""
+    headers = {"Authorization": f"Bearer {token}"}
+    response = get_http().get(f"{API_BASE_URL}/api/auth/me", headers=headers, timeout=API_TIMEOUT)
+    if response.status_code in (401, 403):
+        return None
+    # 서버 오류는 예외로 올려서 캐시되지 않도록 함 (다음 리런에서 다시 시도)
+    response.raise_for_status()
+    return response.json()
+
 def main():
     """메인 함수"""
     # URL 파라미터에서 인증 토큰 확인
     query_params = st.query_params
     if "token" in query_params and not st.session_state.authenticated:
-        token = query_params.get("token", [""])[0]
+        token = query_params["token"]
         
         try:
-            # 토큰으로 사용자 정보 조회
-            headers = {"Authorization": f"Bearer {token}"}
-            response = requests.get(f"{API_BASE_URL}/api/auth/me", headers=headers)
+            # 토큰으로 사용자 정보 조회 (같은 토큰은 캐시된 결과 재사용)
+            user_data = resolve_token(token)
             
-            if response.status_code == 200:
-                user_data = response.json()
+            if user_data is not None:
                 st.session_state.authenticated = True
                 st.session_state.user_data = user_data
                 
-                # URL 파라미터 제거 (새 방법으로는 자동으로 처리됨)
+                # 토큰이 URL에 남아 이 경로를 다시 타지 않도록 파라미터 제거
+                st.query_params.clear()
                 st.rerun()
             else:
                 st.error("인증에 실패했습니다. 다시 로그인해주세요.")
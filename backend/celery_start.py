@@ -12,8 +12,11 @@ def check_redis():
     """Redis 서버가 실행 중인지 확인"""
     try:
         import redis
-        client = redis.Redis(host='localhost', port=6379, decode_responses=True)
+        from config import settings
+        # 하드코딩된 localhost 대신 워커가 실제로 사용할 브로커 주소로 확인
+        client = redis.Redis.from_url(settings.CELERY_BROKER_URL, decode_responses=True)
         client.ping()
+        client.close()
         print("✅ Redis 서버 연결 성공")
         return True
     except Exception as e:
@@ -23,23 +26,24 @@ def check_redis():
         print("  - Docker: docker run -d -p 6379:6379 redis:alpine")
         return False
 
-def start_celery_worker():
-    """Celery 워커 시작"""
+def start_celery_worker(compat_windows: bool = False):
+    """Celery 워커 시작 (새 인터프리터를 띄우지 않고 현재 프로세스에서 실행)"""
     if not check_redis():
         return False
     
     print("🚀 Celery 워커 시작 중...")
     try:
-        # Windows에서는 --pool=solo 옵션 필요
-        cmd = [
-            sys.executable, "-m", "celery",
-            "-A", "tasks",
-            "worker",
-            "--loglevel=info",
-            "--pool=solo"  # Windows 호환성
-        ]
+        from tasks import celery_app
         
-        subprocess.run(cmd)
+        if compat_windows:
+            # 이전 방식과 같은 단일 프로세스 실행 (문제가 생겼을 때만 사용)
+            pool_args = ["--pool=solo"]
+        else:
+            # Windows는 prefork를 지원하지 않으므로 threads 풀 사용
+            pool = "threads" if os.name == "nt" else "prefork"
+            pool_args = [f"--pool={pool}", f"--concurrency={os.cpu_count() or 2}"]
+        
+        celery_app.worker_main(argv=["worker", "--loglevel=info", *pool_args])
         
     except KeyboardInterrupt:
         print("\n🛑 Celery 워커가 중단되었습니다.")
@@ -83,10 +87,16 @@ if __name__ == "__main__":
         help='시작할 서비스 선택'
     )
     
+    parser.add_argument(
+        '--compat-windows',
+        action='store_true',
+        help='워커를 --pool=solo 단일 프로세스로 실행'
+    )
+    
     args = parser.parse_args()
     
     if args.service == 'worker':
-        start_celery_worker()
+        start_celery_worker(compat_windows=args.compat_windows)
     elif args.service == 'flower':
         start_flower()
     elif args.service == 'check':
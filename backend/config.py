@@ -14,12 +14,18 @@ class Settings(BaseSettings):
     
     # Database Configuration
     DATABASE_URL: str = "sqlite:///./automl.db"
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_RECYCLE: int = 1800  # seconds
+    DB_QUERY_CACHE_SIZE: int = 1200
     
     # Security Keys
     JWT_SECRET_KEY: str = "your-jwt-secret-key-here-please-change-in-production"
     SESSION_SECRET_KEY: str = "your-session-secret-key-here-please-change-in-production"
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
+    JWT_VERIFY_CACHE_SIZE: int = 10000
+    JWT_VERIFY_CACHE_TTL: int = 60  # seconds
     
     # URLs and Ports
     STREAMLIT_APP_URL: str = "http://localhost:8501"
@@ -1,10 +1,19 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from database.models import User
 from models import schemas
 from utils.logger import logger
 from typing import Dict, Any
 from fastapi import Request
 
+# Provider name -> User column holding that provider's ID (each column has a unique index)
+PROVIDER_ID_COLUMNS = {
+    "kakao": "kakao_id",
+    "google": "google_id",
+    "naver": "naver_id",
+}
+
 def create_or_update_social_user(
     db: Session,
     user_info: Dict[str, Any],
@@ -18,65 +27,53 @@ def create_or_update_social_user(
     """
     logger.info(f"Attempting to create or update social user for provider: {provider}")
     
-    # Check if user already exists based on provider_id
-    if provider == "kakao":
-        db_user = db.query(User).filter(User.kakao_id == user_info["provider_id"]).first()
-    elif provider == "google":
-        db_user = db.query(User).filter(User.google_id == user_info["provider_id"]).first()
-    elif provider == "naver": # Add Naver
-        db_user = db.query(User).filter(User.naver_id == user_info["provider_id"]).first()
-    else:
+    id_column = PROVIDER_ID_COLUMNS.get(provider)
+    if id_column is None:
         logger.error(f"Unsupported provider in create_or_update_social_user: {provider}")
         raise ValueError("Unsupported provider")
 
-    if db_user:
-        # Update existing user
-        logger.info(f"Updating existing user: {db_user.email}")
-        db_user.email = user_info.get("email", db_user.email)
-        db_user.username = user_info.get("name", db_user.username)
-        # Update provider-specific ID
-        if provider == "kakao":
-            db_user.kakao_id = user_info["provider_id"]
-        elif provider == "google":
-            db_user.google_id = user_info["provider_id"]
-        elif provider == "naver": # Add Naver
-            db_user.naver_id = user_info["provider_id"]
-        
-        # You might want to store the access_token or refresh_token if needed for future API calls
-        # For now, we just log it
-        logger.debug(f"Access token for {provider} user {user_info['provider_id']}: {access_token[:10]}...")
-        
-    else:
-        # Create new user
-        logger.info(f"Creating new user for provider: {provider}, email: {user_info.get('email')}")
-        user_data = {
-            "username": user_info.get("name", f"{provider}_user_{user_info['provider_id']}"),
-            "email": user_info.get("email", f"{provider}_{user_info['provider_id']}@example.com"),
-            "hashed_password": "social_login_user_no_password", # Social users don't have passwords
-            "is_active": True
-        }
-        if provider == "kakao":
-            user_data["kakao_id"] = user_info["provider_id"]
-        elif provider == "google":
-            user_data["google_id"] = user_info["provider_id"]
-        elif provider == "naver": # Add Naver
-            user_data["naver_id"] = user_info["provider_id"]
+    user_data = {
+        "username": user_info.get("name", f"{provider}_user_{user_info['provider_id']}"),
+        "email": user_info.get("email", f"{provider}_{user_info['provider_id']}@example.com"),
+        "hashed_password": "social_login_user_no_password", # Social users don't have passwords
+        "is_active": True,
+        id_column: user_info["provider_id"],
+    }
+
+    # Existing users only get the fields the provider actually returned; the provider ID is the
+    # conflict key, so re-setting it is a no-op that still lets RETURNING hand back the row
+    update_fields = {"email": "email", "name": "username"}
+    set_columns = [column for key, column in update_fields.items() if key in user_info] or [id_column]
 
-        db_user = User(**user_data)
-        db.add(db_user)
+    # Single INSERT ... ON CONFLICT DO UPDATE ... RETURNING round-trip instead of SELECT + write + refresh
+    insert = sqlite_insert if db.get_bind().dialect.name == "sqlite" else pg_insert
+    stmt = insert(User).values(**user_data)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[id_column],
+        set_={column: getattr(stmt.excluded, column) for column in set_columns},
+    ).returning(User)
 
+    db_user = db.scalars(stmt, execution_options={"populate_existing": True}).one()
+    # Detach before commit so the RETURNING values stay loaded instead of being expired and re-SELECTed
+    db.expunge(db_user)
     db.commit()
-    db.refresh(db_user)
     logger.info(f"User {db_user.email} successfully created/updated in DB.")
+
+    # You might want to store the access_token or refresh_token if needed for future API calls
+    # For now, we just log it
+    # Lazy %-args: the message is only built when DEBUG is enabled
+    logger.debug("Access token for %s user %s: %s...", provider, user_info['provider_id'], access_token[:10])
     
     # Store minimal user info in session for immediate use (optional, depends on session middleware)
     # This part might need adjustment based on how session is handled in main.py
     if request:
-        request.session['is_logged_in'] = True
-        request.session['user_id'] = db_user.id
-        request.session['name'] = db_user.username
-        request.session['email'] = db_user.email
-        request.session['provider'] = provider
-        logger.info(f"User info stored in session for {db_user.email}")
+        request.session.update({
+            'is_logged_in': True,
+            'user_id': db_user.id,
+            'name': db_user.username,
+            'email': db_user.email,
+            'provider': provider,
+        })
+        logger.info("User info stored in session for %s", db_user.email)
 
     return db_user
\ No newline at end of file
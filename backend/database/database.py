@@ -5,7 +5,22 @@ from config import settings
 
 SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+if SQLALCHEMY_DATABASE_URL.startswith("sqlite"):
+    # FastAPI는 요청을 여러 스레드에서 처리하므로 SQLite 스레드 검사를 끔
+    engine = create_engine(
+        SQLALCHEMY_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        query_cache_size=settings.DB_QUERY_CACHE_SIZE
+    )
+else:
+    engine = create_engine(
+        SQLALCHEMY_DATABASE_URL,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_pre_ping=True,  # DB 재시작 후 끊긴 연결을 사용 전에 걸러냄
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        query_cache_size=settings.DB_QUERY_CACHE_SIZE  # 컴파일된 SQL 캐시 (모델이 많아 기본값 500보다 크게)
+    )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -17,29 +32,33 @@ def get_db():
     finally:
         db.close()
 
-def init_db():
-    """데이터베이스 테이블 초기화"""
+def init_db(reset: bool = False) -> None:
+    """데이터베이스 테이블 초기화 (reset=True면 개발 환경에서만 기존 스키마를 지우고 새로 만듦)"""
     # 모든 모델을 import 해야 Base.metadata.create_all이 작동
-    from . import models
+    from database import models
     from sqlalchemy import text
+    from utils.env_loader import is_production
     
-    # PostgreSQL에서 CASCADE 옵션으로 안전하게 테이블 삭제
-    try:
-        with engine.connect() as conn:
-            # 외래키 제약조건을 무시하고 모든 테이블 삭제
+    if reset:
+        if is_production():
+            raise RuntimeError("프로덕션 환경에서는 데이터베이스를 초기화할 수 없습니다.")
+        
+        # PostgreSQL에서 CASCADE 옵션으로 모든 테이블 삭제 (한 트랜잭션으로 처리)
+        with engine.begin() as conn:
             conn.execute(text("DROP SCHEMA public CASCADE"))
             conn.execute(text("CREATE SCHEMA public"))
             conn.execute(text("GRANT ALL ON SCHEMA public TO postgres"))
             conn.execute(text("GRANT ALL ON SCHEMA public TO public"))
-            conn.commit()
         print("기존 스키마 재생성 완료")
-    except Exception as e:
-        print(f"스키마 재생성 중 오류 (무시): {e}")
     
-    # 새 테이블 생성
+    # 없는 테이블만 생성
     try:
-        Base.metadata.create_all(bind=engine)
-        print("새 테이블 생성 완료")
+        Base.metadata.create_all(bind=engine, checkfirst=True)
+        print("테이블 생성 확인 완료")
+        
+        # create_all이 바꾸지 않는 기존 테이블의 데이터/타입을 현재 모델에 맞춤
+        from database.migrations import upgrade_existing_schema
+        upgrade_existing_schema(engine)
     except Exception as e:
         print(f"테이블 생성 중 오류: {e}")
         raise e
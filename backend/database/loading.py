@@ -0,0 +1,17 @@
+"""
+조회 경로별 조회 컬럼 정의
+
+응답 스키마가 스칼라 컬럼만 쓰는 목록 경로는 ORM 객체 대신 필요한 컬럼만 Core select로 조회합니다.
+ORM 객체를 만들지 않으므로 관계 지연 로딩(N+1 쿼리)이 일어날 수 없습니다.
+"""
+
+from database.models import ActivityLog
+
+# 활동 로그 목록: 응답 스키마(schemas.ActivityLog)의 필드만 Core select로 조회 (ORM 객체 생성/추적 없음)
+ACTIVITY_LOG_LIST_COLUMNS = (
+    ActivityLog.id,
+    ActivityLog.user_id,
+    ActivityLog.activity_type,
+    ActivityLog.description,
+    ActivityLog.timestamp,
+)
@@ -0,0 +1,90 @@
+"""
+create_all로 처리되지 않는 기존 스키마 변경
+
+create_all(checkfirst=True)은 없는 테이블만 만들고 기존 테이블의 컬럼/타입은 바꾸지 않으므로,
+모델 변경 전에 만들어진 DB를 init_db에서 여기 함수들로 현재 구조에 맞춥니다.
+모든 단계는 여러 번 실행해도 안전합니다.
+"""
+
+import json
+from sqlalchemy import Enum, Integer, String, Text, column, inspect, insert, select, table, text
+
+from database.models import AutoMLRun, ChatMessage, EmailShareLog, MLModelFeature, UserProjectAssociation
+
+# 예전에는 VARCHAR였다가 Enum으로 바뀐 컬럼
+ENUM_COLUMNS = (
+    UserProjectAssociation.__table__.c.role,
+    AutoMLRun.__table__.c.status,
+    ChatMessage.__table__.c.sender,
+    EmailShareLog.__table__.c.status,
+)
+
+
+def backfill_ml_model_features(engine) -> int:
+    """
+    예전 ml_models.features(JSON 문자열) 컬럼의 피처 목록을 ml_model_features 테이블로 복사합니다.
+    이미 피처 행이 있는 모델은 건너뛰고, 예전 컬럼은 지우지 않고 남겨 둡니다.
+    """
+    if "features" not in {col["name"] for col in inspect(engine).get_columns("ml_models")}:
+        return 0
+
+    legacy = table("ml_models", column("id", Integer), column("features", Text))
+    with engine.begin() as conn:
+        migrated = set(conn.execute(select(MLModelFeature.ml_model_id).distinct()).scalars())
+        rows = []
+        for model_id, raw in conn.execute(select(legacy.c.id, legacy.c.features).where(legacy.c.features.isnot(None))):
+            if model_id in migrated:
+                continue
+            try:
+                # JSON/JSONB 컬럼이었다면 드라이버가 이미 리스트로 돌려줌
+                names = json.loads(raw) if isinstance(raw, str) else raw
+            except ValueError:
+                print(f"ml_models.features 파싱 실패 (id={model_id}), 건너뜀")
+                continue
+            if not isinstance(names, list):
+                continue
+            # (ml_model_id, feature_name)이 PK이므로 순서를 유지하며 중복 제거
+            rows.extend({"ml_model_id": model_id, "feature_name": str(name)} for name in dict.fromkeys(names))
+        if rows:
+            conn.execute(insert(MLModelFeature), rows)
+
+    print(f"ml_model_features 백필 완료: {len(rows)}행")
+    return len(rows)
+
+
+def convert_enum_columns(engine) -> int:
+    """
+    PostgreSQL에서 예전 VARCHAR 상태/구분 컬럼을 네이티브 ENUM 타입으로 변환합니다.
+    다른 DB는 Enum도 VARCHAR로 저장하므로 바꿀 것이 없습니다.
+    Enum에 없는 값이 남아 있으면 ALTER가 실패하고 전체 변환이 롤백됩니다.
+    """
+    if engine.dialect.name != "postgresql":
+        return 0
+
+    inspector = inspect(engine)
+    converted = 0
+    with engine.begin() as conn:
+        for model_column in ENUM_COLUMNS:
+            table_name = model_column.table.name
+            current_types = {col["name"]: col["type"] for col in inspector.get_columns(table_name)}
+            current = current_types.get(model_column.name)
+            # 반영된 PostgreSQL ENUM도 String의 하위 타입이므로 Enum 여부를 먼저 확인
+            if current is None or isinstance(current, Enum) or not isinstance(current, String):
+                continue
+            enum_type = model_column.type
+            enum_type.create(conn, checkfirst=True)
+            conn.execute(text(
+                f'ALTER TABLE "{table_name}" ALTER COLUMN "{model_column.name}" '
+                f'TYPE {enum_type.name} USING "{model_column.name}"::{enum_type.name}'
+            ))
+            converted += 1
+
+    if converted:
+        print(f"Enum 컬럼 변환 완료: {converted}개")
+    return converted
+
+
+def upgrade_existing_schema(engine) -> None:
+    """기존 DB에 필요한 데이터 이전 단계를 순서대로 실행"""
+    backfill_ml_model_features(engine)
+    convert_enum_columns(engine)
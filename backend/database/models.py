@@ -1,8 +1,42 @@
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime, Text, Float
-from sqlalchemy.orm import relationship
+import enum
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime, Text, Float, JSON, Index, Enum
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import relationship, deferred
+from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.sql import func
 from .database import Base
 
+# PostgreSQL에서는 JSONB로 저장해 서버에서 파싱/필터링하고, 그 외 DB는 일반 JSON 컬럼 사용
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+
+# 값이 정해진 상태/구분 컬럼은 Enum으로 저장 (PostgreSQL은 4바이트 네이티브 ENUM, 그 외 DB는 VARCHAR + CHECK)
+class ProjectRole(str, enum.Enum):
+    OWNER = "owner"
+    MEMBER = "member"
+
+
+class RunStatus(str, enum.Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class MessageSender(str, enum.Enum):
+    USER = "user"
+    AI = "ai"
+
+
+class ShareStatus(str, enum.Enum):
+    SUCCESS = "success"
+    FAILED = "failed"
+
+
+def _enum_column_type(enum_class, name):
+    """DB에는 멤버 이름(OWNER)이 아니라 값("owner")을 저장해 기존 문자열 데이터와 호환"""
+    return Enum(enum_class, name=name, values_callable=lambda members: [member.value for member in members])
+
 class User(Base):
     __tablename__ = "users"
 
@@ -51,10 +85,11 @@ class UserProjectAssociation(Base):
     __tablename__ = "user_project_association"
     user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
     project_id = Column(Integer, ForeignKey("projects.id"), primary_key=True)
-    role = Column(String, default="member") # e.g., "owner", "member"
+    role = Column(_enum_column_type(ProjectRole, "project_role"), default=ProjectRole.MEMBER)
 
-    user = relationship("User", back_populates="projects")
-    project = relationship("Project", back_populates="members")
+    # 연결 행은 항상 대상 사용자/프로젝트를 함께 읽으므로 JOIN으로 한 번에 로드
+    user = relationship("User", back_populates="projects", lazy="joined")
+    project = relationship("Project", back_populates="members", lazy="joined")
 
 
 class DataSource(Base):
@@ -81,11 +116,40 @@ class MLModel(Base):
     model_type = Column(String) # e.g., Classification, Regression, Clustering
     model_path = Column(String, unique=True, index=True) # Path to the joblib model file
     trained_at = Column(DateTime, server_default=func.now())
-    metrics = Column(Text, nullable=True) # Store metrics as JSON string
+    # 목록 조회에서는 읽지 않는 큰 JSON 컬럼은 실제로 접근할 때 로드 (필요하면 undefer())
+    metrics = deferred(Column(JSONType, nullable=True))
     target_column = Column(String, nullable=True)
-    features = Column(Text, nullable=True) # Store features as JSON string
 
     automl_runs = relationship("AutoMLRun", back_populates="ml_model")
+    feature_links = relationship("MLModelFeature", back_populates="ml_model", cascade="all, delete-orphan")
+    # 학습에 사용한 피처 이름 목록 (model.features = [...] 로 읽고 쓸 수 있음)
+    features = association_proxy(
+        "feature_links", "feature_name", creator=lambda name: MLModelFeature(feature_name=name)
+    )
+
+    __table_args__ = (
+        # 지표 키로 모델을 찾는 쿼리(metrics @> ...)용 GIN 인덱스 (PostgreSQL 전용)
+        Index(
+            "ix_ml_models_metrics",
+            "metrics",
+            postgresql_using="gin",
+            postgresql_ops={"metrics": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
+
+
+class MLModelFeature(Base):
+    __tablename__ = "ml_model_features"
+
+    ml_model_id = Column(Integer, ForeignKey("ml_models.id", ondelete="CASCADE"), primary_key=True)
+    feature_name = Column(String, primary_key=True)
+
+    ml_model = relationship("MLModel", back_populates="feature_links")
+
+    __table_args__ = (
+        # "컬럼 X로 학습한 모델" 조회를 JSON 파싱 없이 인덱스로 처리
+        Index("ix_ml_model_features_feature_name", "feature_name"),
+    )
 
 
 class AutoMLRun(Base):
@@ -97,15 +161,22 @@ class AutoMLRun(Base):
     data_source_id = Column(Integer, ForeignKey("data_sources.id"))
     ml_model_id = Column(Integer, ForeignKey("ml_models.id"), nullable=True) # Link to trained model
     run_at = Column(DateTime, server_default=func.now())
-    status = Column(String, default="completed") # e.g., "pending", "running", "completed", "failed"
-    recommendations = Column(Text, nullable=True) # Store recommendations as JSON string
-    run_details = Column(Text, nullable=True) # Store other run details as JSON string
+    status = Column(_enum_column_type(RunStatus, "run_status"), default=RunStatus.COMPLETED)
+    # 목록 조회에서는 읽지 않는 큰 JSON 컬럼은 실제로 접근할 때 로드 (필요하면 undefer())
+    recommendations = deferred(Column(JSONType, nullable=True), group="run_payload")
+    run_details = deferred(Column(JSONType, nullable=True), group="run_payload")
 
     user = relationship("User", back_populates="automl_runs")
     project = relationship("Project", back_populates="automl_runs")
     data_source = relationship("DataSource", back_populates="automl_runs")
     ml_model = relationship("MLModel", back_populates="automl_runs")
 
+    __table_args__ = (
+        # 사용자별 최근 실행 목록(user_id 필터 + run_at 정렬), 프로젝트별 상태 조회용
+        Index("ix_automl_runs_user_run_at", "user_id", "run_at"),
+        Index("ix_automl_runs_project_status", "project_id", "status"),
+    )
+
 
 class ChatSession(Base):
     __tablename__ = "chat_sessions"
@@ -117,7 +188,8 @@ class ChatSession(Base):
     ended_at = Column(DateTime, nullable=True)
     
     user = relationship("User", back_populates="chat_sessions")
-    messages = relationship("ChatMessage", back_populates="session")
+    # 세션을 읽으면 메시지도 함께 쓰므로 세션 여러 개의 메시지를 IN 쿼리 한 번으로 로드
+    messages = relationship("ChatMessage", back_populates="session", lazy="selectin")
 
 
 class ChatMessage(Base):
@@ -125,12 +197,16 @@ class ChatMessage(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     session_id = Column(Integer, ForeignKey("chat_sessions.id"))
-    sender = Column(String) # "user" or "ai"
+    sender = Column(_enum_column_type(MessageSender, "message_sender"))
     message = Column(Text)
     timestamp = Column(DateTime, server_default=func.now())
 
     session = relationship("ChatSession", back_populates="messages")
 
+    __table_args__ = (
+        Index("ix_chat_messages_session_timestamp", "session_id", "timestamp"),
+    )
+
 
 class VisualizationChart(Base):
     __tablename__ = "visualization_charts"
@@ -156,11 +232,15 @@ class EmailShareLog(Base):
     sender_id = Column(Integer, ForeignKey("users.id"))
     recipient_email = Column(String)
     sent_at = Column(DateTime, server_default=func.now())
-    status = Column(String) # e.g., "success", "failed"
+    status = Column(_enum_column_type(ShareStatus, "share_status"))
 
     chart = relationship("VisualizationChart", back_populates="email_share_logs")
     sender = relationship("User", back_populates="email_share_logs")
 
+    __table_args__ = (
+        Index("ix_email_share_logs_sender_sent_at", "sender_id", "sent_at"),
+    )
+
 
 class SubscriptionPlan(Base):
     __tablename__ = "subscription_plans"
@@ -168,7 +248,7 @@ class SubscriptionPlan(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, unique=True) # e.g., "Free", "Basic", "Premium"
     price = Column(Float)
-    features = Column(Text) # JSON string of features
+    features = Column(JSONType)
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, onupdate=func.now())
 
@@ -200,3 +280,7 @@ class ActivityLog(Base):
     timestamp = Column(DateTime, server_default=func.now())
     
     user = relationship("User", back_populates="activity_logs")
+
+    __table_args__ = (
+        Index("ix_activity_logs_user_timestamp", "user_id", "timestamp"),
+    )
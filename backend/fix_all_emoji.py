@@ -1,43 +1,64 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-import re
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 
-# 이모지 제거 함수
-def remove_emojis(text):
-    emoji_pattern = re.compile("["
-        "\U0001F600-\U0001F64F"  # 감정
-        "\U0001F300-\U0001F5FF"  # 기호 및 픽토그램
-        "\U0001F680-\U0001F6FF"  # 운송 및 지도
-        "\U0001F1E0-\U0001F1FF"  # 국기
-        "\U00002600-\U000026FF"  # 기타 기호
-        "\U00002700-\U000027BF"  # 딩벳
-        "\U0001F900-\U0001F9FF"  # 보조 기호
-        "]+", flags=re.UNICODE)
-    return emoji_pattern.sub('', text)
-
-# 수정할 파일 목록
+from utils.emoji import remove_emojis
+
+# 수정할 파일 목록 (디렉토리를 주면 하위의 .py 파일을 모두 처리)
 files_to_fix = [
     'oauth/social_auth.py'
 ]
 
-for file_path in files_to_fix:
-    if os.path.exists(file_path):
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # 이모지 제거
-            fixed_content = remove_emojis(content)
-            
-            # 파일에 저장
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(fixed_content)
-            
-            print(f"OK {file_path} 이모지 제거 완료!")
-        except Exception as e:
-            print(f"ERROR {file_path} 처리 중 오류: {e}")
-    else:
-        print(f"! {file_path} 파일을 찾을 수 없습니다")
-
-print("모든 이모지 제거 완료!")
\ No newline at end of file
+# 이 크기를 넘는 파일은 소스 코드가 아니라고 보고 건너뜀
+MAX_SOURCE_SIZE = 1024 * 1024
+
+
+def iter_py_files(root):
+    """os.scandir로 한 번만 순회하며 .py 파일 경로를 반환"""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if not entry.name.startswith(('.', '__pycache__')):
+                    yield from iter_py_files(entry.path)
+            elif entry.name.endswith('.py') and 0 < entry.stat().st_size <= MAX_SOURCE_SIZE:
+                yield entry.path
+
+
+def iter_targets(targets):
+    for target in targets:
+        if os.path.isdir(target):
+            yield from iter_py_files(target)
+        else:
+            yield target
+
+
+def process_file(file_path):
+    if not os.path.exists(file_path):
+        return f"! {file_path} 파일을 찾을 수 없습니다"
+    try:
+        with open(file_path, 'r', encoding='utf-8', newline='') as f:
+            content = f.read()
+
+        # 이모지 제거
+        fixed_content = remove_emojis(content)
+        if fixed_content == content:
+            return f"- {file_path} 이모지 없음"
+
+        # 내용이 바뀐 경우에만 파일에 저장
+        with open(file_path, 'w', encoding='utf-8', newline='') as f:
+            f.write(fixed_content)
+
+        return f"OK {file_path} 이모지 제거 완료!"
+    except Exception as e:
+        return f"ERROR {file_path} 처리 중 오류: {e}"
+
+
+if __name__ == '__main__':
+    targets = sys.argv[1:] or files_to_fix
+    with ProcessPoolExecutor() as executor:
+        for message in executor.map(process_file, iter_targets(targets), chunksize=8):
+            print(message)
+
+    print("모든 이모지 제거 완료!")
\ No newline at end of file
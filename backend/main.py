@@ -1,46 +1,55 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 import os
 import logging
+import orjson
+from contextlib import asynccontextmanager
 
 from routes import auth_routes, data_routes, ml_routes, chat_routes, task_routes, user_log_routes
 from oauth import social_auth
-from database.database import init_db
+from database.database import init_db, engine
 from utils.env_loader import load_env
+from utils.logger import stop_logging
 from config import settings
 
 # 환경 변수 로드
 load_env()
 
-# 로깅 설정
-import sys
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s:%(levelname)s:%(message)s',
-    handlers=[
-        logging.FileHandler('logs.log', encoding='utf-8'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# 로깅 설정 (루트 로거는 utils.logger가 QueueHandler로 구성하므로 여기서는 로거만 가져옴)
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """애플리케이션 시작/종료시 실행"""
+    logger.info("Auto ML API 시작")
+    init_db()
+    logger.info("데이터베이스 초기화 완료")
+    logger.info(f"DB 서버 버전: {engine.dialect.server_version_info}, 커넥션 풀: {engine.pool.status()}")
+    # OAuth 콜백에서 공유하는 HTTP 클라이언트
+    app.state.http = social_auth.create_oauth_http_client()
+    yield
+    await app.state.http.aclose()
+    logger.info("Auto ML API 종료")
+    stop_logging()
+
 app = FastAPI(
     title="Auto ML API",
     description="CSV 파일을 업로드하여 머신러닝 모델 학습 및 RAG 챗봇 서비스",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,  # 응답 직렬화를 orjson으로 (datetime 기본 지원)
+    lifespan=lifespan
 )
 
+# CORS 허용 Origin: localhost/127.0.0.1의 Streamlit(8501), FastAPI(8001)
+# Starlette가 미들웨어 생성 시 한 번 컴파일하고 요청마다 fullmatch 한 번으로 검사
+CORS_ORIGIN_REGEX = r"^http://(localhost|127\.0\.0\.1):(8501|8001)$"
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:8501",  # Streamlit
-        "http://localhost:8001",  # FastAPI
-        "http://127.0.0.1:8501",
-        "http://127.0.0.1:8001",
-        # settings.streamlit_app_url if settings.streamlit_app_url else "http://localhost:8501"
-    ],
+    allow_origin_regex=CORS_ORIGIN_REGEX,
     allow_credentials=True,
     allow_methods=["GET", "POST", "DELETE", "OPTIONS", "PUT"],
     allow_headers=["*"],
@@ -66,31 +75,28 @@ app.include_router(ml_routes.router, prefix="/api/ml", tags=["machine learning"]
 app.include_router(chat_routes.router, prefix="/api/chat", tags=["chat & RAG"])
 app.include_router(task_routes.router, prefix="/api/tasks", tags=["async tasks"])
 
-@app.on_event("startup")
-async def startup_event():
-    """애플리케이션 시작시 실행"""
-    logger.info("Auto ML API 시작")
-    init_db()
-    logger.info("데이터베이스 초기화 완료")
+# 루트/헬스 체크 응답은 내용이 고정이라 시작 시 한 번만 직렬화해 둠
+ROOT_BODY = orjson.dumps({
+    "message": "Auto ML API is running",
+    "version": "1.0.0",
+    "features": [
+        "CSV 데이터 업로드 및 분석",
+        "자동 머신러닝 모델 학습",
+        "분류, 회귀, 군집, 추천, 시계열 예측",
+        "RAG 기반 챗봇",
+        "소셜 로그인 (Google, Kakao, Naver)"
+    ]
+})
+HEALTH_BODY = orjson.dumps({"status": "healthy", "timestamp": "2025-09-07"})
 
 @app.get("/")
 async def root():
-    return {
-        "message": "Auto ML API is running",
-        "version": "1.0.0",
-        "features": [
-            "CSV 데이터 업로드 및 분석",
-            "자동 머신러닝 모델 학습",
-            "분류, 회귀, 군집, 추천, 시계열 예측",
-            "RAG 기반 챗봇",
-            "소셜 로그인 (Google, Kakao, Naver)"
-        ]
-    }
+    return Response(ROOT_BODY, media_type="application/json")
 
 @app.get("/health")
 async def health_check():
     """헬스 체크"""
-    return {"status": "healthy", "timestamp": "2025-09-07"}
+    return Response(HEALTH_BODY, media_type="application/json")
 
 if __name__ == "__main__":
     import uvicorn
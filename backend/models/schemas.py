@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 from typing import Optional
 
 class UserBase(BaseModel):
@@ -15,8 +15,7 @@ class User(UserBase):
     google_id: Optional[str] = None
     naver_id: Optional[str] = None
 
-    class Config:
-        from_attributes = True # For Pydantic v2
+    model_config = ConfigDict(from_attributes=True)
 
 from datetime import datetime
 
@@ -32,5 +31,4 @@ class ActivityLog(ActivityLogBase):
     user_id: Optional[int] = None
     timestamp: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -4,15 +4,22 @@ Google, Kakao, Naver 로그인을 지원합니다.
 """
 
 import os
+import hmac
+import asyncio
 import logging
-from typing import Optional, Dict, Any
+import random
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Mapping, Callable, Tuple
+from types import MappingProxyType
+from urllib.parse import quote, urlencode
 from uuid import uuid4
-import traceback
 import time
 
 import httpx
-from fastapi import APIRouter, Request, Depends, HTTPException, status
-from fastapi.responses import RedirectResponse, JSONResponse
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Query, Request, Response, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import RedirectResponse, ORJSONResponse
 from sqlalchemy.orm import Session
 
 # 로컬 프로젝트 DB, 컨트롤러
@@ -24,32 +31,120 @@ from services.user_log_service import UserLogService
 from utils.utils import verify_jwt_token, create_jwt_token
 from utils.logger import logger  # 중앙집중 로거 사용
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 # UserLogService 초기화
 user_log_service = UserLogService()
 
 logger.info(" Social Auth 모듈 초기화 시작")
 
-# OAuth Endpoints URLs
-OAUTH_ENDPOINTS = {
-    "google": {
-        "auth_url": "https://accounts.google.com/o/oauth2/v2/auth",
-        "token_url": "https://oauth2.googleapis.com/token", 
-        "userinfo_url": "https://www.googleapis.com/oauth2/v2/userinfo"
-    },
-    "kakao": {
-        "auth_url": "https://kauth.kakao.com/oauth/authorize",
-        "token_url": "https://kauth.kakao.com/oauth/token",
-        "userinfo_url": "https://kapi.kakao.com/v2/user/me"
-    },
-    "naver": {
-        "auth_url": "https://nid.naver.com/oauth2.0/authorize", 
-        "token_url": "https://nid.naver.com/oauth2.0/token",
-        "userinfo_url": "https://openapi.naver.com/v1/nid/me"
+# 제공업체별 사용자 정보 요청 헤더
+def _bearer_headers(config: Mapping[str, str], access_token: str) -> Dict[str, str]:
+    return {"Authorization": f"Bearer {access_token}"}
+
+def _naver_headers(config: Mapping[str, str], access_token: str) -> Dict[str, str]:
+    return {
+        "Authorization": f"Bearer {access_token}",
+        "X-Naver-Client-Id": config["client_id"],
+        "X-Naver-Client-Secret": config["client_secret"]
     }
+
+# 제공업체별 프로필 응답 -> (사용자 ID, 닉네임, 이메일)
+def _google_profile(profile: Dict[str, Any]):
+    return profile.get("id"), profile.get("name", "Google User"), profile.get("email")
+
+def _kakao_profile(profile: Dict[str, Any]):
+    return (
+        profile.get("id"),
+        profile.get("properties", {}).get("nickname", "Kakao User"),
+        profile.get("kakao_account", {}).get("email")
+    )
+
+def _naver_profile(profile: Dict[str, Any]):
+    naver_response = profile.get("response", {})
+    return naver_response.get("id"), naver_response.get("nickname", "Naver User"), naver_response.get("email")
+
+
+@dataclass(frozen=True)
+class ProviderSpec:
+    """OAuth 제공업체별 고정 정보 (엔드포인트, scope, 헤더/프로필 처리 함수)"""
+    auth_url: str
+    token_url: str
+    userinfo_url: str
+    extract_profile: Callable[[Dict[str, Any]], Tuple[Any, Optional[str], Optional[str]]]
+    userinfo_headers: Callable[[Mapping[str, str], str], Dict[str, str]] = _bearer_headers
+    # 지정하지 않으면 제공업체 콘솔에 설정된 기본 동의 항목 사용
+    scope: Optional[str] = None
+
+
+OAUTH_PROVIDERS: Dict[str, ProviderSpec] = {
+    "google": ProviderSpec(
+        auth_url="https://accounts.google.com/o/oauth2/v2/auth",
+        token_url="https://oauth2.googleapis.com/token",
+        userinfo_url="https://www.googleapis.com/oauth2/v2/userinfo",
+        extract_profile=_google_profile,
+        scope="openid email profile"
+    ),
+    "kakao": ProviderSpec(
+        auth_url="https://kauth.kakao.com/oauth/authorize",
+        token_url="https://kauth.kakao.com/oauth/token",
+        userinfo_url="https://kapi.kakao.com/v2/user/me",
+        extract_profile=_kakao_profile
+    ),
+    "naver": ProviderSpec(
+        auth_url="https://nid.naver.com/oauth2.0/authorize",
+        token_url="https://nid.naver.com/oauth2.0/token",
+        userinfo_url="https://openapi.naver.com/v1/nid/me",
+        extract_profile=_naver_profile,
+        userinfo_headers=_naver_headers
+    )
 }
 
+# 콜백 파라미터 형식 (길이/문자 제한을 벗어나면 핸들러 실행 전에 422로 거절)
+# Google 인증 코드는 "4/0A..." 처럼 '/'를 포함함
+OAUTH_CODE_PATTERN = r"^[A-Za-z0-9._~/\-]+$"
+# state는 login 단계에서 uuid4로 발급
+OAUTH_STATE_PATTERN = r"^[A-Za-z0-9\-]+$"
+
+# 토큰 요청 헤더 (요청마다 같음)
+TOKEN_REQUEST_HEADERS = {
+    "Content-Type": "application/x-www-form-urlencoded",
+    "Accept": "application/json",
+    "User-Agent": "AutoML-Platform/1.0"
+}
+
+# OAuth 제공업체 호출용 HTTP 클라이언트 설정
+OAUTH_HTTP_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+OAUTH_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=100, max_connections=200)
+# 연결 단계 실패 시 최대 시도 횟수 (첫 시도 포함)
+OAUTH_CONNECT_ATTEMPTS = 3
+
+def create_oauth_http_client() -> httpx.AsyncClient:
+    """앱 lifespan에서 한 번 생성해 app.state.http에 두고 모든 콜백에서 재사용"""
+    # HTTP/2: 제공업체 호스트별 연결 하나를 여러 로그인 요청이 다중화해 재사용
+    return httpx.AsyncClient(timeout=OAUTH_HTTP_TIMEOUT, limits=OAUTH_HTTP_LIMITS, http2=True)
+
+def get_oauth_http_client(request: Request) -> httpx.AsyncClient:
+    """공유 HTTP 클라이언트 반환"""
+    return request.app.state.http
+
+async def _send_with_connect_retry(client: httpx.AsyncClient, method: str, url: str, **kwargs) -> httpx.Response:
+    """
+    연결 단계 실패만 지수 백오프 + 지터로 재시도합니다.
+    인가 코드는 한 번만 쓸 수 있으므로 요청이 전송됐을 수 있는 오류나 4xx/5xx 응답은 재시도하지 않습니다.
+    """
+    for attempt in range(OAUTH_CONNECT_ATTEMPTS):
+        try:
+            return await client.request(method, url, **kwargs)
+        except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+            if attempt == OAUTH_CONNECT_ATTEMPTS - 1:
+                raise
+            delay = min(0.2 * 2 ** attempt, 2.0) + random.random() * 0.1
+            logger.warning("OAuth 서버 연결 실패, %.2f초 후 재시도 (%s/%s): %s", delay, attempt + 1, OAUTH_CONNECT_ATTEMPTS - 1, e)
+            await asyncio.sleep(delay)
+
+_EMPTY_PROVIDER_CONFIG: Mapping[str, str] = MappingProxyType({})
+
 # 환경변수 로드 및 검증
 class OAuthConfig:
     """OAuth 설정 관리 클래스"""
@@ -76,9 +171,71 @@ class OAuthConfig:
         self.jwt_algorithm = os.getenv("JWT_ALGORITHM", "HS256")
         self.streamlit_app_url = os.getenv("STREAMLIT_APP_URL", "http://localhost:8501")
         
+        # 제공업체별 설정은 한 번만 만들어 두고 요청마다 재사용 (공유 객체이므로 읽기 전용)
+        self._provider_configs = {
+            "google": MappingProxyType({
+                "client_id": self.google_client_id,
+                "client_secret": self.google_client_secret,
+                "redirect_uri": self.google_redirect_uri
+            }),
+            "kakao": MappingProxyType({
+                "client_id": self.kakao_client_id,
+                "client_secret": self.kakao_client_secret,
+                "redirect_uri": self.kakao_redirect_uri
+            }),
+            "naver": MappingProxyType({
+                "client_id": self.naver_client_id,
+                "client_secret": self.naver_client_secret,
+                "redirect_uri": self.naver_redirect_uri
+            })
+        }
+        
+        # 인가 URL은 state만 요청마다 바뀌므로 나머지 파라미터는 미리 인코딩해 템플릿으로 보관
+        self._auth_url_templates = {
+            provider: self._build_auth_url_template(provider, config)
+            for provider, config in self._provider_configs.items()
+        }
+        
+        # 토큰 요청 본문 중 제공업체별로 고정된 부분
+        self._token_body_prefixes = {
+            provider: urlencode({
+                "client_id": config["client_id"],
+                "client_secret": config["client_secret"],
+                "redirect_uri": config["redirect_uri"],
+                "grant_type": "authorization_code"
+            }).encode()
+            for provider, config in self._provider_configs.items()
+        }
+        
         # 환경변수 검증 및 로깅
         self._validate_and_log_config()
     
+    @staticmethod
+    def _build_auth_url_template(provider: str, config: Mapping[str, str]) -> str:
+        """제공업체 인가 URL 템플릿 생성 ({state} 자리만 남김)"""
+        params = {
+            "client_id": config["client_id"],
+            "redirect_uri": config["redirect_uri"],
+            "response_type": "code",
+        }
+        spec = OAUTH_PROVIDERS[provider]
+        if spec.scope:
+            params["scope"] = spec.scope
+        # quote는 중괄호도 인코딩하므로 format 자리는 {state} 하나만 남음
+        query = urlencode(params, quote_via=quote)
+        return f"{spec.auth_url}?{query}&state={{state}}"
+    
+    def build_token_body(self, provider: str, code: str, state: Optional[str]) -> bytes:
+        """토큰 요청 본문 (application/x-www-form-urlencoded)"""
+        body = self._token_body_prefixes[provider] + b"&code=" + quote(code, safe="").encode()
+        if provider == "naver" and state:
+            body += b"&state=" + quote(state, safe="").encode()  # Naver는 토큰 요청에도 state 필요
+        return body
+    
+    def build_auth_url(self, provider: str, state: str) -> str:
+        """state(서버에서 만든 UUID)를 채운 인가 URL 반환"""
+        return self._auth_url_templates[provider].format(state=state)
+    
     def _validate_and_log_config(self):
         """환경변수 검증 및 상세 로깅"""
         logger.info(" OAuth 환경변수 상세 검증:")
@@ -86,7 +243,7 @@ class OAuthConfig:
         providers_status = {}
         
         # Google 설정 검증
-        google_valid = all([self.google_client_id, self.google_client_secret])
+        google_valid = bool(self.google_client_id) and bool(self.google_client_secret)
         providers_status["google"] = google_valid
         logger.info(f"   Google: {' 설정완료' if google_valid else ' 설정필요'}")
         logger.info(f"    - Client ID: {' 있음' if self.google_client_id else ' 없음'}")
@@ -94,7 +251,7 @@ class OAuthConfig:
         logger.info(f"    - Redirect URI: {self.google_redirect_uri}")
         
         # Kakao 설정 검증
-        kakao_valid = all([self.kakao_client_id, self.kakao_client_secret])
+        kakao_valid = bool(self.kakao_client_id) and bool(self.kakao_client_secret)
         providers_status["kakao"] = kakao_valid
         logger.info(f"  🟡 Kakao: {' 설정완료' if kakao_valid else ' 설정필요'}")
         logger.info(f"    - Client ID: {' 있음' if self.kakao_client_id else ' 없음'}")
@@ -102,7 +259,7 @@ class OAuthConfig:
         logger.info(f"    - Redirect URI: {self.kakao_redirect_uri}")
         
         # Naver 설정 검증
-        naver_valid = all([self.naver_client_id, self.naver_client_secret])
+        naver_valid = bool(self.naver_client_id) and bool(self.naver_client_secret)
         providers_status["naver"] = naver_valid
         logger.info(f"  🟢 Naver: {' 설정완료' if naver_valid else ' 설정필요'}")
         logger.info(f"    - Client ID: {' 있음' if self.naver_client_id else ' 없음'}")
@@ -131,43 +288,78 @@ class OAuthConfig:
         
         return providers_status
     
-    def get_provider_config(self, provider: str) -> Dict[str, str]:
-        """특정 제공업체 설정 반환"""
-        configs = {
-            "google": {
-                "client_id": self.google_client_id,
-                "client_secret": self.google_client_secret,
-                "redirect_uri": self.google_redirect_uri
-            },
-            "kakao": {
-                "client_id": self.kakao_client_id,
-                "client_secret": self.kakao_client_secret,
-                "redirect_uri": self.kakao_redirect_uri
-            },
-            "naver": {
-                "client_id": self.naver_client_id,
-                "client_secret": self.naver_client_secret,
-                "redirect_uri": self.naver_redirect_uri
-            }
-        }
-        return configs.get(provider, {})
+    def get_provider_config(self, provider: str) -> Mapping[str, str]:
+        """특정 제공업체 설정 반환 (읽기 전용)"""
+        return self._provider_configs.get(provider, _EMPTY_PROVIDER_CONFIG)
 
 # OAuth 설정 인스턴스 생성
 oauth_config = OAuthConfig()
 
-SUPPORTED_PROVIDERS = {"google", "kakao", "naver"}
+SUPPORTED_PROVIDERS = frozenset({"google", "kakao", "naver"})
+# client_id/secret이 모두 설정된 제공업체 (설정은 시작 후 바뀌지 않음)
+CONFIGURED_PROVIDERS = frozenset(
+    provider for provider in SUPPORTED_PROVIDERS
+    if oauth_config.get_provider_config(provider).get("client_id")
+    and oauth_config.get_provider_config(provider).get("client_secret")
+)
 logger.info(f" 지원 제공업체: {', '.join(SUPPORTED_PROVIDERS)}")
 
 
+# 헬스체크 및 유틸리티 엔드포인트
+# 고정 경로는 /{provider}보다 먼저 등록해야 provider 경로에 가려지지 않음
+# 제공업체 설정은 시작 후 바뀌지 않으므로 응답 내용을 한 번만 만들어 둠
+PROVIDER_STATUS = {}
+_debug_provider_info = {}
+for _provider in SUPPORTED_PROVIDERS:
+    _config = oauth_config.get_provider_config(_provider)
+    PROVIDER_STATUS[_provider] = {
+        "configured": bool(_config.get("client_id") and _config.get("client_secret")),
+        "redirect_uri": _config.get("redirect_uri", "")
+    }
+    _debug_provider_info[_provider] = {
+        "client_id_configured": bool(_config.get("client_id")),
+        "client_secret_configured": bool(_config.get("client_secret")),
+        "redirect_uri": _config.get("redirect_uri", "")
+    }
+
+DEBUG_CONFIG_BODY = orjson.dumps({
+    "oauth_config": _debug_provider_info,
+    "jwt_configured": oauth_config.jwt_secret_key != "your-jwt-secret-key-here-please-change-in-production",
+    "streamlit_url": oauth_config.streamlit_app_url
+})
+
+@router.get("/health")
+async def health_check():
+    """소셜 로그인 헬스체크"""
+    logger.debug("소셜 로그인 헬스체크 요청")
+    
+    return ORJSONResponse({
+        "status": "healthy",
+        "timestamp": int(time.time()),
+        "providers": PROVIDER_STATUS,
+        "supported_providers": list(SUPPORTED_PROVIDERS)
+    })
+
+
+@router.get("/debug/config")
+async def debug_config():
+    """디버깅용 설정 정보 (민감정보 제외)"""
+    logger.info(" 디버그 설정 정보 요청")
+    
+    return Response(DEBUG_CONFIG_BODY, media_type="application/json")
+
+
 @router.get("/{provider}")
 async def oauth_login(provider: str, request: Request):
-    """OAuth 로그인 시작 - 상세 로깅 포함"""
-    logger.info("=" * 60)
-    logger.info(f" OAuth 로그인 요청 시작")
-    logger.info(f" 요청 정보:")
-    logger.info(f"  - Provider: {provider}")
-    logger.info(f"  - Client IP: {request.client.host if request.client else 'Unknown'}")
-    logger.info(f"  - User Agent: {request.headers.get('user-agent', 'Unknown')[:50]}...")
+    """OAuth 로그인 시작"""
+    # 로그 인자는 %s로 넘겨 해당 레벨이 꺼져 있으면 문자열을 만들지 않음
+    logger.info("OAuth 로그인 요청: provider=%s", provider)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "요청 정보: client IP=%s, user agent=%s",
+            request.client.host if request.client else "Unknown",
+            request.headers.get("user-agent", "Unknown")[:50],
+        )
     
     # 제공업체 검증
     if provider not in SUPPORTED_PROVIDERS:
@@ -195,9 +387,7 @@ async def oauth_login(provider: str, request: Request):
         request.session["oauth_state"] = state
         request.session["oauth_provider"] = provider
         request.session["oauth_timestamp"] = str(int(time.time()))
-        logger.info(f" OAuth 세션 정보 저장 완료:")
-        logger.info(f"  - State: {state[:8]}...{state[-8:]}")
-        logger.info(f"  - Provider: {provider}")
+        logger.debug("OAuth 세션 정보 저장 완료: state=%s..., provider=%s", state[:8], provider)
     except Exception as e:
         logger.error(f" 세션 저장 실패: {str(e)}")
         raise HTTPException(
@@ -207,47 +397,14 @@ async def oauth_login(provider: str, request: Request):
 
     # OAuth URL 생성
     try:
-        endpoints = OAUTH_ENDPOINTS[provider]
-        auth_url = endpoints["auth_url"]
-        
-        if provider == "google":
-            redirect_url = (
-                f"{auth_url}?"
-                f"client_id={provider_config['client_id']}&"
-                f"redirect_uri={provider_config['redirect_uri']}&"
-                f"response_type=code&"
-                f"scope=openid%20email%20profile&"
-                f"state={state}"
-            )
-        elif provider == "kakao":
-            redirect_url = (
-                f"{auth_url}?"
-                f"client_id={provider_config['client_id']}&"
-                f"redirect_uri={provider_config['redirect_uri']}&"
-                f"response_type=code&"
-                f"state={state}"
-            )
-        elif provider == "naver":
-            redirect_url = (
-                f"{auth_url}?"
-                f"client_id={provider_config['client_id']}&"
-                f"redirect_uri={provider_config['redirect_uri']}&"
-                f"response_type=code&"
-                f"state={state}"
-            )
+        redirect_url = oauth_config.build_auth_url(provider, state)
         
-        logger.info(f" OAuth URL 생성 완료:")
-        logger.info(f"  - Provider: {provider}")
-        logger.info(f"  - Auth URL: {auth_url}")
-        logger.info(f"  - Redirect URI: {provider_config['redirect_uri']}")
-        logger.info(f"  - Full URL: {redirect_url[:100]}...")
-        logger.info("=" * 60)
+        logger.debug("OAuth URL 생성 완료: %s", redirect_url[:100])
         
         return RedirectResponse(url=redirect_url, status_code=status.HTTP_302_FOUND)
         
     except Exception as e:
-        logger.error(f" OAuth URL 생성 실패: {str(e)}")
-        logger.error(f" 에러 상세: {traceback.format_exc()}")
+        logger.error("OAuth URL 생성 실패: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="OAuth URL 생성 중 오류가 발생했습니다"
@@ -257,256 +414,195 @@ async def oauth_login(provider: str, request: Request):
 @router.get("/{provider}/callback")
 async def oauth_callback(
     provider: str,
-    code: str,
-    state: Optional[str] = None,
-    error: Optional[str] = None,
-    error_description: Optional[str] = None,
+    code: Optional[str] = Query(None, max_length=1024, pattern=OAUTH_CODE_PATTERN),
+    state: Optional[str] = Query(None, max_length=128, pattern=OAUTH_STATE_PATTERN),
+    error: Optional[str] = Query(None, max_length=256),
+    error_description: Optional[str] = Query(None, max_length=1024),
     request: Request = None,
+    background_tasks: BackgroundTasks = None,
     db: Session = Depends(get_db)
 ):
-    """OAuth 콜백 처리 - 완전한 로깅 및 에러 처리"""
-    logger.info("=" * 80)
-    logger.info(f" OAuth 콜백 요청 수신")
-    logger.info(f" 콜백 정보:")
-    logger.info(f"  - Provider: {provider}")
-    logger.info(f"  - Code: {' 있음' if code else ' 없음'}")
-    logger.info(f"  - State: {state[:8] + '...' + state[-8:] if state else ' 없음'}")
-    logger.info(f"  - Error: {error if error else '없음'}")
-    logger.info(f"  - Error Description: {error_description if error_description else '없음'}")
-    logger.info(f"  - Client IP: {request.client.host if request.client else 'Unknown'}")
+    """OAuth 콜백 처리"""
+    logger.info("OAuth 콜백 수신: provider=%s", provider)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "콜백 정보: code=%s, state=%s, error=%s, client IP=%s",
+            "있음" if code else "없음",
+            state[:8] + "..." if state else "없음",
+            error or "없음",
+            request.client.host if request.client else "Unknown",
+        )
     
     # OAuth 에러 확인
     if error:
-        logger.error(f" OAuth 제공업체에서 에러 반환:")
-        logger.error(f"  - Error: {error}")
-        logger.error(f"  - Description: {error_description}")
+        logger.error("OAuth 제공업체에서 에러 반환: %s - %s", error, error_description)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"OAuth 인증 실패: {error} - {error_description}"
         )
     
     if not code:
-        logger.error(f" 인증 코드가 없습니다")
+        logger.error("인증 코드가 없습니다")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="OAuth 인증 코드가 제공되지 않았습니다"
         )
     
-    # 제공업체 검증
-    if provider not in SUPPORTED_PROVIDERS:
-        logger.error(f" 지원하지 않는 프로바이더: {provider}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"지원하지 않는 프로바이더: {provider}"
-        )
-    
-    # 제공업체 설정 확인
-    provider_config = oauth_config.get_provider_config(provider)
-    if not provider_config.get("client_id") or not provider_config.get("client_secret"):
-        logger.error(f" {provider} OAuth 설정이 불완전합니다")
+    # 제공업체 검증: 정상 요청은 집합 조회 한 번으로 통과하고, 실패할 때만 원인을 구분
+    if provider not in CONFIGURED_PROVIDERS:
+        if provider not in SUPPORTED_PROVIDERS:
+            logger.error("지원하지 않는 프로바이더: %s", provider)
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"지원하지 않는 프로바이더: {provider}"
+            )
+        logger.error("%s OAuth 설정이 불완전합니다", provider)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"{provider} OAuth 설정이 완료되지 않았습니다"
         )
+    provider_config = oauth_config.get_provider_config(provider)
 
     # State 검증
     saved_state = request.session.get("oauth_state")
     saved_provider = request.session.get("oauth_provider")
     saved_timestamp = request.session.get("oauth_timestamp")
     
-    logger.info(f" State 및 세션 검증:")
-    logger.info(f"  - 저장된 State: {saved_state[:8] + '...' + saved_state[-8:] if saved_state else ' 없음'}")
-    logger.info(f"  - 받은 State: {state[:8] + '...' + state[-8:] if state else ' 없음'}")
-    logger.info(f"  - 저장된 Provider: {saved_provider}")
-    logger.info(f"  - 받은 Provider: {provider}")
-    logger.info(f"  - 저장된 시간: {saved_timestamp}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "State 검증: 저장된 state=%s, 저장된 provider=%s, 저장된 시간=%s",
+            saved_state[:8] + "..." if saved_state else "없음", saved_provider, saved_timestamp,
+        )
     
-    if not saved_state or state != saved_state:
-        logger.error(f" State 검증 실패")
-        logger.error(f"  - 저장된: {saved_state}")
-        logger.error(f"  - 받은: {state}")
+    # 상수 시간 비교로 state 값이 타이밍으로 새지 않도록 함
+    if not saved_state or not hmac.compare_digest(state or "", saved_state):
+        logger.error("State 검증 실패: 저장된=%s, 받은=%s", saved_state, state)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="CSRF 보호 - State 검증 실패"
         )
     
     if saved_provider != provider:
-        logger.error(f" Provider 불일치: 저장됨={saved_provider}, 받음={provider}")
+        logger.error("Provider 불일치: 저장됨=%s, 받음=%s", saved_provider, provider)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Provider 불일치"
         )
 
     # 액세스 토큰 요청
-    logger.info(f" 액세스 토큰 요청 시작")
+    spec = OAUTH_PROVIDERS[provider]
+    token_url = spec.token_url
     
-    endpoints = OAUTH_ENDPOINTS[provider]
-    token_url = endpoints["token_url"]
-    
-    token_data = {
-        "code": code,
-        "client_id": provider_config["client_id"],
-        "client_secret": provider_config["client_secret"],
-        "redirect_uri": provider_config["redirect_uri"],
-        "grant_type": "authorization_code"
-    }
+    # 고정 파라미터는 미리 인코딩된 본문을 쓰고 code(, state)만 덧붙임
+    token_body = oauth_config.build_token_body(provider, code, state)
     
-    if provider == "naver":
-        token_data["state"] = state  # Naver는 토큰 요청에도 state 필요
-    
-    logger.info(f" 토큰 요청 세부사항:")
-    logger.info(f"  - URL: {token_url}")
-    logger.info(f"  - Client ID: {provider_config['client_id'][:8]}...")
-    logger.info(f"  - Redirect URI: {provider_config['redirect_uri']}")
+    logger.debug("토큰 요청: url=%s, redirect_uri=%s", token_url, provider_config["redirect_uri"])
     
+    # 앱 수명 동안 공유하는 클라이언트 (제공업체 호스트와의 연결/TLS 세션 재사용)
+    client = get_oauth_http_client(request)
+
     try:
-        timeout = httpx.Timeout(30.0, connect=10.0)
-        headers = {
-            "Content-Type": "application/x-www-form-urlencoded",
-            "Accept": "application/json",
-            "User-Agent": "AutoML-Platform/1.0"
-        }
+        token_response = await _send_with_connect_retry(
+            client,
+            "POST",
+            token_url,
+            content=token_body,
+            headers=TOKEN_REQUEST_HEADERS
+        )
         
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            logger.info(f" 토큰 요청 전송 중...")
-            
-            token_response = await client.post(
-                token_url,
-                data=token_data,
-                headers=headers
+        logger.debug("토큰 응답 상태 코드: %s", token_response.status_code)
+        if logger.isEnabledFor(logging.DEBUG):
+            # 헤더 dict 복사는 DEBUG일 때만
+            logger.debug("  - 응답 헤더: %s", dict(token_response.headers))
+        
+        if token_response.status_code != 200:
+            logger.error("토큰 요청 실패: %s %s", token_response.status_code, token_response.text)
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"OAuth 토큰 획득 실패: {token_response.status_code}"
+            )
+        
+        tokens = orjson.loads(token_response.content)
+        access_token = tokens.get("access_token")
+        
+        if not access_token:
+            logger.error("토큰 응답에 access_token이 없습니다: keys=%s", list(tokens))
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="액세스 토큰을 찾을 수 없습니다"
             )
-            
-            logger.info(f" 토큰 응답 수신:")
-            logger.info(f"  - 상태 코드: {token_response.status_code}")
-            logger.info(f"  - 응답 헤더: {dict(token_response.headers)}")
-            
-            if token_response.status_code != 200:
-                error_text = token_response.text
-                logger.error(f" 토큰 요청 실패:")
-                logger.error(f"  - 상태 코드: {token_response.status_code}")
-                logger.error(f"  - 응답: {error_text}")
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"OAuth 토큰 획득 실패: {token_response.status_code}"
-                )
-            
-            tokens = token_response.json()
-            access_token = tokens.get("access_token")
-            
-            if not access_token:
-                logger.error(f" 토큰 응답에 access_token이 없습니다:")
-                logger.error(f"  - 응답 키: {list(tokens.keys())}")
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="액세스 토큰을 찾을 수 없습니다"
-                )
-            
-            logger.info(f" 액세스 토큰 획득 성공")
-            logger.info(f"  - 토큰 길이: {len(access_token)}")
-            
+        
+        logger.debug("액세스 토큰 획득 성공")
+        
     except httpx.TimeoutException as e:
-        logger.error(f"⏱️ 토큰 요청 타임아웃: {str(e)}")
+        logger.error("토큰 요청 타임아웃: %s", e)
         raise HTTPException(
             status_code=status.HTTP_504_GATEWAY_TIMEOUT,
             detail="OAuth 서버 응답 시간 초과"
         )
     except httpx.ConnectError as e:
-        logger.error(f" 토큰 요청 연결 실패: {str(e)}")
+        logger.error("토큰 요청 연결 실패: %s", e)
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
             detail="OAuth 서버 연결 실패"
         )
     except Exception as e:
-        logger.error(f" 토큰 요청 예외: {type(e).__name__}: {str(e)}")
-        logger.error(f" 상세 추적: {traceback.format_exc()}")
+        logger.error("토큰 요청 예외: %s: %s", type(e).__name__, e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="토큰 요청 중 예상치 못한 오류"
         )
 
     # 사용자 정보 요청
-    logger.info(f" 사용자 정보 요청 시작")
-    
-    userinfo_url = endpoints["userinfo_url"]
+    userinfo_url = spec.userinfo_url
     
     try:
-        userinfo_headers = {"Authorization": f"Bearer {access_token}"}
+        userinfo_headers = spec.userinfo_headers(provider_config, access_token)
         
-        if provider == "naver":
-            userinfo_headers.update({
-                "X-Naver-Client-Id": provider_config["client_id"],
-                "X-Naver-Client-Secret": provider_config["client_secret"]
-            })
+        userinfo_response = await _send_with_connect_retry(
+            client,
+            "GET",
+            userinfo_url,
+            headers=userinfo_headers
+        )
+        
+        logger.debug("사용자 정보 응답 상태 코드: %s", userinfo_response.status_code)
         
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            logger.info(f" 사용자 정보 요청 전송: {userinfo_url}")
-            
-            userinfo_response = await client.get(
-                userinfo_url,
-                headers=userinfo_headers
+        if userinfo_response.status_code != 200:
+            logger.error("사용자 정보 요청 실패: %s %s", userinfo_response.status_code, userinfo_response.text)
+            raise HTTPException(
+                status_code=status.HTTP_502_BAD_GATEWAY,
+                detail=f"사용자 정보 획득 실패: {userinfo_response.status_code}"
             )
-            
-            logger.info(f" 사용자 정보 응답:")
-            logger.info(f"  - 상태 코드: {userinfo_response.status_code}")
-            
-            if userinfo_response.status_code != 200:
-                error_text = userinfo_response.text
-                logger.error(f" 사용자 정보 요청 실패:")
-                logger.error(f"  - 상태 코드: {userinfo_response.status_code}")
-                logger.error(f"  - 응답: {error_text}")
-                raise HTTPException(
-                    status_code=status.HTTP_502_BAD_GATEWAY,
-                    detail=f"사용자 정보 획득 실패: {userinfo_response.status_code}"
-                )
-            
-            profile = userinfo_response.json()
-            logger.info(f" 원본 프로필 데이터: {profile}")
-            
-            # 제공업체별 사용자 정보 추출
-            if provider == "google":
-                user_id = profile.get("id")
-                nickname = profile.get("name", "Google User")
-                email = profile.get("email")
-                
-            elif provider == "kakao":
-                user_id = profile.get("id")
-                nickname = profile.get("properties", {}).get("nickname", "Kakao User")
-                email = profile.get("kakao_account", {}).get("email")
-                
-            elif provider == "naver":
-                naver_response = profile.get("response", {})
-                user_id = naver_response.get("id")
-                nickname = naver_response.get("nickname", "Naver User")
-                email = naver_response.get("email")
-            
-            logger.info(f" 사용자 정보 추출 완료:")
-            logger.info(f"  - Provider: {provider}")
-            logger.info(f"  - User ID: {user_id}")
-            logger.info(f"  - Nickname: {nickname}")
-            logger.info(f"  - Email: {email}")
-            
-            if not user_id:
-                logger.error(f" 사용자 ID를 찾을 수 없습니다")
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="사용자 ID를 찾을 수 없습니다"
-                )
-            
+        
+        profile = orjson.loads(userinfo_response.content)
+        logger.debug("원본 프로필 데이터: %s", profile)
+        
+        # 제공업체별 사용자 정보 추출
+        user_id, nickname, email = spec.extract_profile(profile)
+        
+        logger.debug("사용자 정보 추출 완료: provider=%s, id=%s, nickname=%s, email=%s", provider, user_id, nickname, email)
+        
+        if not user_id:
+            logger.error("사용자 ID를 찾을 수 없습니다")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="사용자 ID를 찾을 수 없습니다"
+            )
+        
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f" 사용자 정보 요청 예외: {type(e).__name__}: {str(e)}")
-        logger.error(f" 상세 추적: {traceback.format_exc()}")
+        logger.error("사용자 정보 요청 예외: %s: %s", type(e).__name__, e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="사용자 정보 요청 중 오류"
         )
 
-    # 데이터베이스에 사용자 저장
-    logger.info(f" 사용자 정보 데이터베이스 저장 시작")
-    
+    # 데이터베이스에 사용자 저장 (동기 DB 호출이 이벤트 루프를 막지 않도록 스레드풀에서 실행)
     try:
-        user = create_or_update_social_user(
+        user = await run_in_threadpool(
+            create_or_update_social_user,
             db=db,
             user_info={
                 "provider_id": str(user_id),
@@ -518,30 +614,24 @@ async def oauth_callback(
             access_token=access_token
         )
         
-        logger.info(f" 사용자 정보 데이터베이스 저장 완료:")
-        logger.info(f"  - DB User ID: {user.id}")
-        logger.info(f"  - Username: {user.username}")
-        logger.info(f"  - Email: {user.email}")
+        logger.info("소셜 로그인 사용자 저장 완료: provider=%s, user_id=%s", provider, user.id)
         
-        # 로그인 활동 기록
-        user_log_service.record_activity(
-            db=db,
+        # 로그인 활동 기록은 리디렉션 응답을 보낸 뒤 별도 세션으로 처리
+        background_tasks.add_task(
+            user_log_service.record_activity_in_new_session,
             user_id=user.id,
             activity_type="login",
             description=f"소셜 로그인 성공 ({provider}): {nickname}"
         )
         
     except Exception as e:
-        logger.error(f" 데이터베이스 저장 예외: {type(e).__name__}: {str(e)}")
-        logger.error(f" 상세 추적: {traceback.format_exc()}")
+        logger.error("데이터베이스 저장 예외: %s: %s", type(e).__name__, e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="사용자 정보 저장 실패"
         )
 
     # JWT 토큰 생성
-    logger.info(f" JWT 토큰 생성 시작")
-    
     try:
         jwt_payload = {
             "sub": str(user_id),
@@ -554,13 +644,10 @@ async def oauth_callback(
         
         jwt_token = create_jwt_token(jwt_payload)
         
-        logger.info(f" JWT 토큰 생성 완료:")
-        logger.info(f"  - 토큰 길이: {len(jwt_token)}")
-        logger.info(f"  - 페이로드 키: {list(jwt_payload.keys())}")
+        logger.debug("JWT 토큰 생성 완료: payload keys=%s", list(jwt_payload))
         
     except Exception as e:
-        logger.error(f" JWT 토큰 생성 예외: {type(e).__name__}: {str(e)}")
-        logger.error(f" 상세 추적: {traceback.format_exc()}")
+        logger.error("JWT 토큰 생성 예외: %s: %s", type(e).__name__, e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="인증 토큰 생성 실패"
@@ -571,17 +658,15 @@ async def oauth_callback(
         request.session.pop("oauth_state", None)
         request.session.pop("oauth_provider", None)
         request.session.pop("oauth_timestamp", None)
-        logger.info(f" OAuth 세션 정리 완료")
+        logger.debug("OAuth 세션 정리 완료")
     except Exception as e:
-        logger.warning(f"️ 세션 정리 중 경고: {str(e)}")
+        logger.warning("세션 정리 중 경고: %s", e)
 
     # 최종 리디렉션
     redirect_url = f"{oauth_config.streamlit_app_url}?token={jwt_token}&login=success"
     
-    logger.info(f" 최종 리디렉션:")
-    logger.info(f"  - Streamlit URL: {oauth_config.streamlit_app_url}")
-    logger.info(f"  - Full URL: {redirect_url[:100]}...")
-    logger.info("=" * 80)
+    # 리디렉션 URL에는 JWT가 들어 있으므로 앱 주소만 기록
+    logger.debug("최종 리디렉션: %s", oauth_config.streamlit_app_url)
     
     return RedirectResponse(
         url=redirect_url,
@@ -589,48 +674,4 @@ async def oauth_callback(
     )
 
 
-# 헬스체크 및 유틸리티 엔드포인트
-@router.get("/health")
-async def health_check():
-    """소셜 로그인 헬스체크"""
-    logger.info(" 소셜 로그인 헬스체크 요청")
-    
-    # 각 제공업체 설정 상태 확인
-    provider_status = {}
-    for provider in SUPPORTED_PROVIDERS:
-        config = oauth_config.get_provider_config(provider)
-        provider_status[provider] = {
-            "configured": bool(config.get("client_id") and config.get("client_secret")),
-            "redirect_uri": config.get("redirect_uri", "")
-        }
-    
-    return JSONResponse({
-        "status": "healthy",
-        "timestamp": int(time.time()),
-        "providers": provider_status,
-        "supported_providers": list(SUPPORTED_PROVIDERS)
-    })
-
-
-@router.get("/debug/config")
-async def debug_config():
-    """디버깅용 설정 정보 (민감정보 제외)"""
-    logger.info(" 디버그 설정 정보 요청")
-    
-    debug_info = {}
-    for provider in SUPPORTED_PROVIDERS:
-        config = oauth_config.get_provider_config(provider)
-        debug_info[provider] = {
-            "client_id_configured": bool(config.get("client_id")),
-            "client_secret_configured": bool(config.get("client_secret")),
-            "redirect_uri": config.get("redirect_uri", "")
-        }
-    
-    return JSONResponse({
-        "oauth_config": debug_info,
-        "jwt_configured": oauth_config.jwt_secret_key != "your-jwt-secret-key-here-please-change-in-production",
-        "streamlit_url": oauth_config.streamlit_app_url
-    })
-
-
 logger.info(" Social Auth 모듈 초기화 완료")
\ No newline at end of file
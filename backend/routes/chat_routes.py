@@ -1,4 +1,6 @@
+import json
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from typing import Optional, Dict, Any
 from pydantic import BaseModel
 from utils.logger import logger
@@ -15,6 +17,13 @@ class ChatRequest(BaseModel):
     model_path: Optional[str] = None
     trained_model_info: Optional[Dict[str, Any]] = None
 
+class ChatMessageRequest(BaseModel):
+    message: str
+    user_id: Optional[str] = None  # 게스트 로그인은 "guest"를 보냄
+    conversation_id: Optional[str] = None
+    dataframe_path: Optional[str] = None
+    model_path: Optional[str] = None
+
 @router.post("/chat/")
 async def chat_with_model(request: ChatRequest):
     """
@@ -32,4 +41,30 @@ async def chat_with_model(request: ChatRequest):
         return {"response": response}
     except Exception as e:
         logger.error(f"Error during chat API call for query '{request.user_query}': {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=f"챗봇 응답 생성 중 오류가 발생했습니다: {e}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"챗봇 응답 생성 중 오류가 발생했습니다: {e}")
+
+@router.post("/message")
+async def stream_chat_message(request: ChatMessageRequest):
+    """
+    챗봇 응답을 SSE 스트림(data: {"delta": "..."} 이벤트)으로 반환합니다.
+    """
+    logger.info(f"Received streaming chat message (conversation: {request.conversation_id})")
+
+    async def event_stream():
+        try:
+            async for delta in rag_service.stream_rag_response(
+                user_query=request.message,
+                dataframe_path=request.dataframe_path,
+                model_path=request.model_path
+            ):
+                yield f"data: {json.dumps({'delta': delta}, ensure_ascii=False)}\n\n"
+        except Exception as e:
+            logger.error(f"Error while streaming chat response: {e}", exc_info=True)
+            yield f"data: {json.dumps({'error': '챗봇 응답 생성 중 오류가 발생했습니다.'}, ensure_ascii=False)}\n\n"
+
+    # 프록시(nginx 등)가 응답을 모아서 보내지 않도록 버퍼링/캐시를 끔
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
\ No newline at end of file
@@ -1,9 +1,9 @@
 from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Form # Add Form
 from typing import List, Optional, Dict, Any # Add Optional, Dict, Any
 import pandas as pd
-import io # Added for BytesIO
 import os
 from utils.logger import logger
+from config import settings
 from services.data_service import process_uploaded_csv, get_dataframe_info, get_column_unique_values, UPLOAD_DIR
 from services.auto_ml import AutoMLService # Add this import
 
@@ -23,9 +23,14 @@ async def upload_csv(file: UploadFile = File(...), target_column: Optional[str]
         logger.warning(f"Invalid file upload attempt: {file.filename} is not a CSV.")
         raise HTTPException(status_code=400, detail="CSV 파일만 업로드할 수 있습니다.")
 
+    if file.size is not None and file.size > settings.MAX_FILE_SIZE:
+        logger.warning(f"Rejected upload {file.filename}: {file.size} bytes exceeds MAX_FILE_SIZE.")
+        raise HTTPException(status_code=413, detail="업로드 가능한 최대 파일 크기를 초과했습니다.")
+
     try:
-        contents = await file.read()
-        df = pd.read_csv(io.BytesIO(contents))
+        # 업로드 임시 파일에서 바로 파싱 (파일 전체를 bytes로 한 번 더 들고 있지 않음)
+        await file.seek(0)
+        df = pd.read_csv(file.file)
 
         # Process the CSV and get file_path
         # This part now only saves the file and returns its path
@@ -41,12 +46,20 @@ async def upload_csv(file: UploadFile = File(...), target_column: Optional[str]
         )
 
         logger.info(f"CSV file '{file.filename}' uploaded and AutoML pipeline executed successfully.")
+
+        # dtype 종류 코드로 한 번에 집계 (select_dtypes처럼 임시 DataFrame을 만들지 않음)
+        dtype_kinds = [dtype.kind for dtype in df.dtypes]
         
         # Combine results
         response_data = {
             "message": f"파일 '{file.filename}'이 성공적으로 업로드 및 AutoML 분석이 완료되었습니다.",
             "file_path": file_path,
-            "auto_ml_results": auto_ml_results["results"] # Contains recommendations, training_result, predictions
+            "auto_ml_results": auto_ml_results["results"], # Contains recommendations, training_result, predictions
+            # Basic shape stats so the frontend never has to re-parse the whole file
+            "row_count": len(df),
+            "col_count": len(df.columns),
+            "numeric_count": sum(kind in "iufc" for kind in dtype_kinds),
+            "categorical_count": dtype_kinds.count("O")
         }
         return response_data
     except Exception as e:
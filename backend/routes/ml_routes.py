@@ -1,4 +1,5 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
+from fastapi.responses import ORJSONResponse
 from typing import List, Optional, Dict, Any
 from utils.logger import logger
 from services.ml_service import train_model
@@ -38,6 +39,7 @@ import pandas as pd # For DataFrame conversion
 import io # For BytesIO
 import os
 import glob
+import hashlib
 
 class PredictModelRequest(BaseModel):
     model_path: str = Field(..., description="예측에 사용할 학습된 모델의 경로")
@@ -64,17 +66,16 @@ async def predict_ml_model(request: PredictModelRequest):
         raise HTTPException(status_code=500, detail=f"예측 중 오류가 발생했습니다: {e}")
 
 @router.get("/models")
-async def get_models():
+async def get_models(request: Request):
     """
     저장된 모델 목록을 조회합니다.
+    목록이 바뀌지 않았으면 ETag로 비교해 본문 없이 304를 반환합니다.
     """
     logger.info("Received request to get saved models")
     try:
-        # models 디렉토리에서 저장된 모델 파일들 검색
+        # models 디렉토리에서 저장된 모델 파일들 검색 (없으면 만들고 빈 목록을 같은 형식/ETag로 반환)
         models_dir = "models"
-        if not os.path.exists(models_dir):
-            os.makedirs(models_dir)
-            return {"models": [], "message": "모델 디렉토리가 생성되었습니다. 학습된 모델이 없습니다."}
+        os.makedirs(models_dir, exist_ok=True)
         
         # .pkl 또는 .joblib 파일들을 검색
         model_files = []
@@ -92,7 +93,14 @@ async def get_models():
             models.append(model_info)
         
         logger.info(f"Found {len(models)} models")
-        return {"models": models, "total": len(models)}
+
+        # 파일 이름/크기/생성 시각으로 목록 버전을 만든다
+        fingerprint = "|".join(f"{m['name']}:{m['size']}:{m['created_time']}" for m in sorted(models, key=lambda m: m["name"]))
+        etag = f'"{hashlib.sha1(fingerprint.encode()).hexdigest()}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+
+        return ORJSONResponse({"models": models, "total": len(models)}, headers={"ETag": etag})
     except Exception as e:
         logger.error(f"Error getting saved models: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"모델 목록 조회 중 오류가 발생했습니다: {e}")
@@ -1,13 +1,54 @@
-from fastapi import APIRouter
+import asyncio
+import time
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 from tasks import get_task_status, cancel_task
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 router = APIRouter()
 
+# long-poll 중 상태를 다시 확인하는 간격(초)
+LONG_POLL_INTERVAL = 0.5
+
+# 한 번에 조회할 수 있는 태스크 수 (Celery 결과 백엔드 조회가 ID마다 일어남)
+MAX_STATUS_IDS = 50
+
+@router.get("/status")
+async def get_task_statuses_endpoint(
+    # Celery 태스크 ID(UUID 36자) + 쉼표 기준으로 MAX_STATUS_IDS개 분량
+    ids: str = Query(..., max_length=MAX_STATUS_IDS * 37, description="쉼표로 구분한 태스크 ID 목록")
+) -> Dict[str, Dict[str, Any]]:
+    """여러 태스크 상태를 한 번의 요청으로 조회"""
+    task_ids = list(dict.fromkeys(task_id for task_id in ids.split(",", MAX_STATUS_IDS) if task_id))
+    if len(task_ids) > MAX_STATUS_IDS:
+        raise HTTPException(status_code=400, detail=f"한 번에 최대 {MAX_STATUS_IDS}개의 태스크만 조회할 수 있습니다")
+    return await run_in_threadpool(lambda: {task_id: get_task_status(task_id) for task_id in task_ids})
+
 @router.get("/status/{task_id}")
-async def get_task_status_endpoint(task_id: str) -> Dict[str, Any]:
-    """태스크 상태 조회"""
-    return get_task_status(task_id)
+async def get_task_status_endpoint(
+    task_id: str,
+    wait: float = Query(0, ge=0, le=60, description="상태가 바뀔 때까지 기다릴 최대 시간(초)"),
+    last_status: Optional[str] = Query(None, description="클라이언트가 마지막으로 받은 상태"),
+    last_progress: Optional[int] = Query(None, description="클라이언트가 마지막으로 받은 진행률")
+) -> Dict[str, Any]:
+    """
+    태스크 상태 조회
+
+    wait가 주어지면 long-poll로 동작합니다. 상태가 클라이언트가 알고 있는
+    last_status/last_progress와 달라지는 즉시, 또는 wait초가 지나면 응답합니다.
+    """
+    deadline = time.monotonic() + wait
+    task_status = await run_in_threadpool(get_task_status, task_id)
+
+    while (
+        task_status.get("status") == last_status
+        and task_status.get("progress") == last_progress
+        and time.monotonic() < deadline
+    ):
+        await asyncio.sleep(LONG_POLL_INTERVAL)
+        task_status = await run_in_threadpool(get_task_status, task_id)
+
+    return task_status
 
 @router.post("/cancel/{task_id}")
 async def cancel_task_endpoint(task_id: str) -> Dict[str, bool]:
@@ -1,7 +1,7 @@
 import logging
 import pandas as pd
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator
 from utils.logger import logger
 from .ml_service import load_model # To load trained models
 
@@ -90,4 +90,25 @@ class RAGService:
         )
         
         logger.info("RAG response generated.")
-        return simulated_response
\ No newline at end of file
+        return simulated_response
+
+    async def stream_rag_response(
+        self,
+        user_query: str,
+        dataframe_path: Optional[str] = None,
+        model_path: Optional[str] = None,
+        trained_model_info: Optional[Dict[str, Any]] = None,
+        chunk_size: int = 16
+    ) -> AsyncIterator[str]:
+        """
+        RAG 응답을 조각(delta) 단위로 생성합니다.
+        실제 LLM 클라이언트가 붙으면 모델이 내보내는 토큰을 그대로 흘려보내면 됩니다.
+        """
+        response = await self.get_rag_response(
+            user_query=user_query,
+            dataframe_path=dataframe_path,
+            model_path=model_path,
+            trained_model_info=trained_model_info
+        )
+        for start in range(0, len(response), chunk_size):
+            yield response[start:start + chunk_size]
\ No newline at end of file
@@ -1,5 +1,8 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from database.database import SessionLocal
 from database.models import ActivityLog
+from database.loading import ACTIVITY_LOG_LIST_COLUMNS
 from utils.logger import logger
 from typing import Optional
 
@@ -36,6 +39,25 @@ class UserLogService:
             db.rollback()
             raise
 
+    def record_activity_in_new_session(
+        self,
+        user_id: Optional[int],
+        activity_type: str,
+        description: str
+    ) -> None:
+        """
+        자체 DB 세션으로 활동을 기록합니다. (BackgroundTasks 용)
+        응답을 보낸 뒤 실행되므로 요청 세션과 분리하고, 실패해도 로그만 남깁니다.
+        """
+        db = SessionLocal()
+        try:
+            self.record_activity(db, user_id, activity_type, description)
+        except Exception:
+            # record_activity에서 이미 상세 오류를 기록함
+            pass
+        finally:
+            db.close()
+
     def get_user_activities(
         self,
         db: Session,
@@ -47,12 +69,13 @@ class UserLogService:
         """
         사용자 활동 로그를 조회합니다.
         """
-        query = db.query(ActivityLog)
+        stmt = select(*ACTIVITY_LOG_LIST_COLUMNS)
         if user_id:
-            query = query.filter(ActivityLog.user_id == user_id)
+            stmt = stmt.where(ActivityLog.user_id == user_id)
         if activity_type:
-            query = query.filter(ActivityLog.activity_type == activity_type)
+            stmt = stmt.where(ActivityLog.activity_type == activity_type)
         
-        logs = query.order_by(ActivityLog.timestamp.desc()).offset(offset).limit(limit).all()
+        stmt = stmt.order_by(ActivityLog.timestamp.desc()).offset(offset).limit(limit)
+        logs = db.execute(stmt).mappings().all()
         logger.info(f"Retrieved {len(logs)} activity logs for user {user_id if user_id else 'all'}.")
         return logs
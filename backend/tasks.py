@@ -8,7 +8,7 @@
 from celery import Celery
 from celery.result import AsyncResult
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, lambda_stmt, select
 import logging
 import traceback
 from typing import Dict, Any
@@ -65,16 +65,20 @@ def train_model_task(self, model_id: int) -> Dict[str, Any]:
     
     try:
         # 모델과 데이터셋 정보 로드
-        model = db.query(MLModel).filter(MLModel.id == model_id).first()
+        # 기본키 조회는 db.get으로 (식별자 맵에 있으면 SQL 없이 반환)
+        model = db.get(MLModel, model_id)
         if not model:
             raise ValueError(f"모델 ID {model_id}를 찾을 수 없습니다")
         
         # Get the AutoMLRun associated with this model to find the data source
-        automl_run = db.query(AutoMLRun).filter(AutoMLRun.ml_model_id == model_id).first()
+        # lambda_stmt: 구문과 캐시 키를 처음 한 번만 만들고 이후에는 model_id 값만 바인딩
+        automl_run = db.execute(
+            lambda_stmt(lambda: select(AutoMLRun).where(AutoMLRun.ml_model_id == model_id).limit(1))
+        ).scalars().first()
         if not automl_run:
             raise ValueError(f"모델 ID {model_id}와 연관된 AutoML 실행을 찾을 수 없습니다")
             
-        data_source = db.query(DataSource).filter(DataSource.id == automl_run.data_source_id).first()
+        data_source = db.get(DataSource, automl_run.data_source_id)
         if not data_source:
             raise ValueError(f"데이터소스 ID {automl_run.data_source_id}를 찾을 수 없습니다")
         
@@ -136,8 +140,8 @@ def train_model_task(self, model_id: int) -> Dict[str, Any]:
     except Exception as e:
         # 에러 발생시 모델 상태 업데이트
         error_msg = f"모델 훈련 실패: {str(e)}"
-        logger.error(f"❌ {error_msg}")
-        logger.error(f"상세 오류: {traceback.format_exc()}")
+        # 트레이스백은 로깅 핸들러가 포맷하도록 exc_info로 넘김
+        logger.error(f"❌ {error_msg}", exc_info=True)
         
         if 'model' in locals():
             model.training_status = "failed"
@@ -171,7 +175,7 @@ def generate_predictions_task(self, model_id: int, input_data: Dict[str, Any]) -
     db = SessionLocal()
     
     try:
-        model = db.query(MLModel).filter(MLModel.id == model_id).first()
+        model = db.get(MLModel, model_id)
         if not model:
             raise ValueError(f"모델 ID {model_id}를 찾을 수 없습니다")
         
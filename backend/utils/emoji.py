@@ -0,0 +1,20 @@
+"""
+소스 코드에서 이모지를 제거하는 유틸리티 (fix_emoji.py, fix_all_emoji.py에서 공용으로 사용)
+"""
+
+import re
+
+# 모듈 로드 시 한 번만 컴파일
+EMOJI_RE = re.compile("["
+    "\U0001F600-\U0001F64F"  # 감정
+    "\U0001F300-\U0001F5FF"  # 기호 및 픽토그램
+    "\U0001F680-\U0001F6FF"  # 운송 및 지도
+    "\U0001F1E0-\U0001F1FF"  # 국기
+    "\U00002600-\U000026FF"  # 기타 기호
+    "\U00002700-\U000027BF"  # 딩벳
+    "\U0001F900-\U0001F9FF"  # 보조 기호
+    "]+", flags=re.UNICODE)
+
+def remove_emojis(text: str) -> str:
+    """이모지 제거 (한 번의 sub로 처리, 바뀌었는지는 호출하는 쪽에서 문자열 비교)"""
+    return EMOJI_RE.sub('', text)
@@ -1,11 +1,23 @@
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from config import settings
 
+# 로그 파일 하나의 최대 크기와 보관할 백업 파일 수
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+
+_listener = None
+
 def setup_logging():
+    global _listener
     log_level = logging.INFO if settings.APP_ENV == "local" else logging.WARNING
     
-    # UTF-8 인코딩으로 파일 핸들러 생성
-    file_handler = logging.FileHandler("app.log", encoding='utf-8')
+    # UTF-8 인코딩으로 파일 핸들러 생성 (크기 제한으로 디스크 사용량 제한)
+    file_handler = RotatingFileHandler(
+        "app.log", maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding='utf-8'
+    )
     file_handler.setLevel(log_level)
     
     # 스트림 핸들러도 UTF-8로 설정
@@ -18,12 +30,24 @@ def setup_logging():
     file_handler.setFormatter(formatter)
     stream_handler.setFormatter(formatter)
     
+    # 실제 파일/콘솔 쓰기는 리스너 스레드가 담당하고, 로깅 호출은 큐에 넣기만 함
+    log_queue = queue.Queue(-1)
+    _listener = QueueListener(log_queue, file_handler, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+    
     # 로거 설정
     logger = logging.getLogger()
     logger.setLevel(log_level)
-    logger.addHandler(file_handler)
-    logger.addHandler(stream_handler)
+    logger.addHandler(QueueHandler(log_queue))
     
     return logging.getLogger(__name__)
 
+def stop_logging():
+    """큐에 남은 로그를 모두 기록하고 리스너 스레드 종료 (여러 번 호출해도 안전)"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
 logger = setup_logging()
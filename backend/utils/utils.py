@@ -1,20 +1,34 @@
+import hashlib
+import threading
+import time
 from datetime import datetime, timedelta
 from typing import Dict, Any
-from jose import jwt, JWTError
+from cachetools import TTLCache
+from jose import jwk, jwt, JWTError
 from fastapi import HTTPException, status
 from config import settings
 from utils.logger import logger
 
+# 서명 키는 설정에서 한 번만 만들어 두고 토큰 생성/검증마다 재사용
+_JWT_KEY = jwk.construct(settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM)
+_JWT_ALGORITHMS = [settings.JWT_ALGORITHM]
+# 발급하는 토큰에는 항상 exp/sub가 있으므로 없는 토큰은 거절
+_JWT_DECODE_OPTIONS = {"require_exp": True, "require_sub": True}
+
+# 검증된 토큰의 페이로드 캐시 (원본 토큰 대신 SHA-256 digest를 키로 저장)
+_verified_tokens = TTLCache(maxsize=settings.JWT_VERIFY_CACHE_SIZE, ttl=settings.JWT_VERIFY_CACHE_TTL)
+_verified_tokens_lock = threading.Lock()
+
 def create_jwt_token(data: Dict[str, Any]) -> str:
     """
     주어진 데이터를 사용하여 JWT(JSON Web Token)를 생성합니다.
     사용자 인증 후 클라이언트에게 발급되어, 이후 요청 시 사용자 신원을 확인하는 데 사용됩니다.
     """
     to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(minutes=settings.JWT_EXPIRE_MINUTES)
+    expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
-    logger.info(f"JWT token created for sub: {data.get('sub')}")
+    encoded_jwt = jwt.encode(to_encode, _JWT_KEY, algorithm=settings.JWT_ALGORITHM)
+    logger.info("JWT token created for sub: %s", data.get("sub"))
     return encoded_jwt
 
 def verify_jwt_token(token: str) -> Dict[str, Any]:
@@ -23,13 +37,31 @@ def verify_jwt_token(token: str) -> Dict[str, Any]:
     클라이언트로부터 받은 토큰의 유효성을 확인하고, 토큰에 포함된 사용자 정보를 추출합니다.
     """
     try:
-        payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
-        logger.info(f"JWT token verified for sub: {payload.get('sub')}")
+        payload = jwt.decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS, options=_JWT_DECODE_OPTIONS)
+        logger.debug("JWT token verified for sub: %s", payload.get("sub"))
         return payload
     except JWTError as e:
-        logger.warning(f"JWT verification failed: {e}")
+        logger.warning("JWT verification failed: %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="유효하지 않은 인증 토큰입니다.",
             headers={"WWW-Authenticate": "Bearer"},
         )
+
+def verify_jwt_token_cached(token: str) -> Dict[str, Any]:
+    """
+    verify_jwt_token 결과를 JWT_VERIFY_CACHE_TTL초 동안 캐시합니다.
+    캐시 유지 시간 안에 만료되는 토큰은 저장하지 않으므로 만료된 토큰이 통과하지 않습니다.
+    """
+    key = hashlib.sha256(token.encode()).digest()
+    with _verified_tokens_lock:
+        payload = _verified_tokens.get(key)
+    if payload is not None:
+        return payload
+
+    payload = verify_jwt_token(token)
+    exp = payload.get("exp")
+    if exp is not None and exp - time.time() > settings.JWT_VERIFY_CACHE_TTL:
+        with _verified_tokens_lock:
+            _verified_tokens[key] = payload
+    return payload
@@ -3,14 +3,9 @@ frontend.utils.env_loader.load_environment_variables()
 
 import streamlit as st
 import pandas as pd
-import time
 import os
-import tempfile
-import json
-from typing import Optional, Dict, Any, List
+from typing import Dict, Any
 import logging
-from datetime import datetime
-from pathlib import Path
 import jwt
 import requests
 